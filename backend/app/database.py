@@ -1,21 +1,75 @@
 """Database setup using SQLModel."""
 from sqlmodel import SQLModel, create_engine, Session
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
 from typing import Generator
 import os
 
 # SQLite database path
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/pewpew.db")
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
 
-engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
+# SQLite tuning applied to every new DBAPI connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # Readers no longer block the writer
+    "PRAGMA synchronous=NORMAL",  # fsync on checkpoint instead of every commit
+    "PRAGMA busy_timeout=5000",  # Wait up to 5s for a lock instead of failing
+    "PRAGMA cache_size=-20000",  # ~20MB page cache (negative = KiB)
+    "PRAGMA temp_store=MEMORY",  # Keep temp tables/indices off disk
+)
+
+
+def _execute_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply performance PRAGMAs when SQLite opens a writer connection."""
+    _execute_pragmas(dbapi_connection, SQLITE_PRAGMAS)
+    # Let SQLAlchemy emit BEGIN itself (see _begin_immediate)
+    dbapi_connection.isolation_level = None
+
+
+def _begin_immediate(conn):
+    """Take the write lock up front so writers never deadlock upgrading a read lock."""
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+# Writer engine: SQLite allows a single writer, so one pooled connection is enough
+write_engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    poolclass=QueuePool,
+    pool_size=1 if IS_SQLITE else 5,
+    max_overflow=0 if IS_SQLITE else 10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+)
+
+if IS_SQLITE:
+    event.listen(write_engine, "connect", _apply_sqlite_pragmas)
+    event.listen(write_engine, "begin", _begin_immediate)
+
+# Backward-compatible alias
+engine = write_engine
 
 
 def init_db():
     """Initialize database tables."""
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(write_engine)
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Dependency for getting database session."""
-    with Session(engine) as session:
+def get_write_session() -> Generator[Session, None, None]:
+    """Dependency for getting a read-write database session."""
+    with Session(write_engine) as session:
         yield session
 
+
+# Backward-compatible alias
+get_session = get_write_session
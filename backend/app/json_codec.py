@@ -0,0 +1,16 @@
+"""orjson-backed JSON codec for python-socketio (passed as AsyncServer(json=...))."""
+import orjson
+
+
+# Non-str dict keys are stringified (as the stdlib json module does); unknown types fall back to str()
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: object, *args, **kwargs) -> str:
+    """Serialize to a compact JSON string; socketio's separators kwarg is implied by orjson."""
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS).decode()
+
+
+def loads(s, *args, **kwargs):
+    """Parse JSON from str or bytes."""
+    return orjson.loads(s)
@@ -1,7 +1,8 @@
 """Pydantic models for PewPew Tabletop game."""
-from typing import Optional, Literal, List, Dict, Any, Union
+from typing import Optional, Literal, List, Dict, Any, Set, Union
 from datetime import datetime
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer, model_serializer
 from enum import Enum
 
 
@@ -106,19 +107,43 @@ class ScanResult(BaseModel):
     player_name: Optional[str] = None
 
 
+class IOC(BaseModel):
+    """Indicators of compromise attached to an alert; template-specific keys are kept as extras."""
+    model_config = ConfigDict(extra="allow")
+    
+    ip: Optional[str] = None
+    domain: Optional[str] = None
+    hash: Optional[str] = None
+    source_ip: Optional[str] = None
+    target: Optional[str] = None
+    
+    def __bool__(self) -> bool:
+        # Empty IOC is falsy, like the dict it replaced
+        return bool(self.model_fields_set or self.model_extra)
+    
+    @model_serializer(mode="wrap")
+    def _drop_unset(self, handler):
+        # Serialize only the keys that are present (clients render every key)
+        return {k: v for k, v in handler(self).items() if v is not None}
+
+
 class Alert(BaseModel):
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
     id: str
     timestamp: datetime
     source: str  # IDS, EDR, Proxy, WAF, DB
     severity: str  # low, medium, high, critical
     summary: str
     details: str
-    ioc: Dict[str, Any] = Field(default_factory=dict)
+    ioc: IOC = Field(default_factory=IOC)
     confidence: float = 1.0
     hint_ref: Optional[str] = None
 
 
 class BlueAction(BaseModel):
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
     id: str
     actor: str = "blue"
     type: BlueActionType
@@ -156,6 +181,21 @@ class Scenario(BaseModel):
     red_briefing: Optional[Dict[str, Any]] = None  # Red team briefing (terminal style)
     blue_briefing: Optional[Dict[str, Any]] = None  # Blue team briefing (FBI alert style)
     max_turns_per_side: Optional[int] = None  # Maximum turns per side (None = unlimited, 3 = three turns per side)
+    
+    _attacks_by_id: Dict[str, Attack] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        # Index attacks once when the scenario is built (i.e. when the cache is loaded)
+        self._attacks_by_id = {a.id: a for a in self.attacks}
+    
+    @property
+    def attacks_by_id(self) -> Dict[str, Attack]:
+        """Attacks keyed by id."""
+        return self._attacks_by_id
+    
+    def get_attack(self, attack_id: str) -> Optional[Attack]:
+        """Look up an attack by id."""
+        return self._attacks_by_id.get(attack_id)
 
 
 class Score(BaseModel):
@@ -164,9 +204,31 @@ class Score(BaseModel):
     mttd: Optional[float] = None  # Mean Time To Detection (seconds)
     mttc: Optional[float] = None  # Mean Time To Containment (seconds)
     round_breakdown: List[Dict[str, Any]] = Field(default_factory=list)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Score totals as sent in score_update events (round_breakdown left out)."""
+        return {"red": self.red, "blue": self.blue, "mttd": self.mttd, "mttc": self.mttc}
+
+
+# GameState fields included in the reconnection snapshot
+SNAPSHOT_GAME_STATE_FIELDS = frozenset({
+    "status",
+    "round",
+    "current_scenario_id",
+    "mode",
+    "audience_enabled",
+    "timer",
+    "current_turn",
+})
 
 
 class GameState(BaseModel):
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
+    # Bumped on every field assignment; snapshot() is recomputed only when it changes
+    _version: int = PrivateAttr(default=0)
+    _snapshot: Optional[tuple] = PrivateAttr(default=None)  # (version, snapshot dict)
+    
     id: str = "default"
     status: GameStatus = GameStatus.LOBBY
     round: int = 0
@@ -197,13 +259,39 @@ class GameState(BaseModel):
     red_pivot_votes: Dict[str, str] = Field(default_factory=dict)  # player_name -> pivot_strategy ("lateral", "alternative", "persistence")
     red_attack_selected: bool = False  # Whether Red team has selected an attack via voting
     red_attack_votes: Dict[str, str] = Field(default_factory=dict)  # player_name -> attack_id (which attack they voted for)
-    red_scan_ips: List[str] = Field(default_factory=list)  # IP addresses used for scanning
-    blocked_ips: List[str] = Field(default_factory=list)  # IP addresses blocked by Blue team
+    red_scan_ips: Set[str] = Field(default_factory=set)  # IP addresses used for scanning
+    blocked_ips: Set[str] = Field(default_factory=set)  # IP addresses blocked by Blue team
     red_briefing_dismissed: bool = False  # Whether Red team has dismissed the briefing (timer starts after this)
     # Per-turn action limits
     red_scan_this_turn: bool = False  # Whether Red team has scanned this turn
     red_attack_this_turn: bool = False  # Whether Red team has attacked this turn
     blue_action_this_turn: bool = False  # Whether Blue team has acted this turn
+    
+    @field_serializer("red_scan_ips", "blocked_ips")
+    def _serialize_ip_set(self, ips: Set[str]) -> List[str]:
+        # Sets for O(1) membership; clients get a stable, sorted list
+        return sorted(ips)
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter of field assignments."""
+        return self._version
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        JSON-ready projection of SNAPSHOT_GAME_STATE_FIELDS for reconnecting clients.
+        
+        Cached until the next field assignment (snapshot fields are all scalars, so
+        in-place list/dict mutations cannot make it stale). Do not mutate the result.
+        """
+        if self._snapshot is None or self._snapshot[0] != self._version:
+            self._snapshot = (self._version, self.model_dump(mode="json", include=SNAPSHOT_GAME_STATE_FIELDS))
+        return self._snapshot[1]
 
 
 class EventKind(str, Enum):
@@ -233,6 +321,8 @@ class EventKind(str, Enum):
 
 
 class Event(BaseModel):
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
     id: str
     kind: EventKind
     ts: datetime = Field(default_factory=datetime.utcnow)
@@ -267,6 +357,8 @@ class GameStartRequest(BaseModel):
 
 class AttackInstance(BaseModel):
     """Tracks attack lifecycle with timing (only used if FEATURE_TIMELINE_SLA is True)."""
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
+    
     attack_id: str
     scenario_id: str
     attack_type: AttackType
@@ -422,15 +514,21 @@ class ChatRequest(BaseModel):
 # Activity Models
 # ============================================================================
 
-class ActivityEvent(BaseModel):
-    """Player activity event."""
+@dataclass(slots=True)
+class ActivityEvent:
+    """
+    Player activity event.
+    
+    A slotted dataclass rather than a model: one is built per tracked activity and the
+    fields are already validated by ActivityRequest. orjson serializes it natively.
+    """
     id: str
     player_name: str
     role: Literal["red", "blue", "gm", "audience"]
     activity_type: str  # e.g., "viewing_artifact", "preparing_attack", "analyzing_alert"
     description: str
     timestamp: datetime
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class ActivityRequest(BaseModel):
@@ -1,28 +1,158 @@
 """Blue team action routes."""
 from fastapi import APIRouter, HTTPException
-from app.models import ActionRequest, BlueAction, Event, EventKind, GameStatus
+from fastapi.responses import ORJSONResponse
+from app.models import ActionRequest, BlueAction, EventKind, GameStatus
 from app.routes.game import game_state
 from app.routes.scenarios import scenarios_cache
 from app.routes.attacks import launched_attacks
-from app.services.resolver import resolve_outcome
+from app.routes.score import current_score
+from app.services.resolver import attribution_pattern, resolve_outcome
+from app.services.turn import advance_blue_turn
+from app.services.votes import VoteTally
 from app.ws import broadcaster, create_event
 from app.settings import settings
+from app.store import add_events
+import asyncio
+from collections import deque
 from datetime import datetime
-import uuid
+from typing import Dict, List
+import functools
+import itertools
+import logging
+import secrets
+import time
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/actions", tags=["actions"])
 
-# Store blue actions for the current round
-blue_actions: list[BlueAction] = []
 
+# Optimal response per attack type for identify-action votes (anything else: block_ip)
+CORRECT_ACTION_BY_TYPE = {
+    "RCE": "update_waf",  # Optimal for pre-exploitation RCE
+    "SQLI": "update_waf",
+    "LATERALMOVE": "block_ip",  # Network attacks
+    "BRUTEFORCE": "block_ip",  # block_ip or update_waf
+}
 
-@router.post("/investigate-attack")
-async def investigate_attack(request: dict) -> dict:
-    """Submit a vote for whether the attack succeeded or was blocked."""
-    from app.routes.score import current_score
-    from app.routes.attacks import launched_attacks
-    from app.routes.scenarios import scenarios_cache
+
+# Score explanation reasons, keyed by bit; a resolution ORs together the ones that fired
+_REASON_BLOCKED = 0b0001
+_REASON_QUICK = 0b0010
+_REASON_CORRECT_ATTRIBUTION = 0b0100
+_REASON_WRONG_ATTRIBUTION = 0b1000
+_SCORE_REASONS = {
+    _REASON_BLOCKED: "Blocked attack (+8)",
+    _REASON_QUICK: "Quick response (+5)",
+    _REASON_CORRECT_ATTRIBUTION: "Correct attribution (+2)",
+    _REASON_WRONG_ATTRIBUTION: "Wrong attribution (-1)",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _score_explanation(mask: int) -> str:
+    """Join the reasons set in mask, in display order."""
+    return ", ".join(reason for bit, reason in _SCORE_REASONS.items() if bit & mask) or "No score change"
+
+
+# Optional resolve_outcome fields copied into the attack_resolved payload as-is
+_OUTCOME_PASSTHROUGH_KEYS = ("attack_succeeded", "success_indicators", "action_evaluations", "emitted_alerts")
+
+# Resolution results reported as blocked in the legacy effectiveness field
+_BLOCKED_RESULTS = frozenset({"successful_block", "blocked"})
+
+
+# Blue actions awaiting resolution against the current attack (bounded; consumed when it resolves)
+blue_actions: deque[BlueAction] = deque(maxlen=settings.MAX_BLUE_ACTIONS_PER_ROUND)
+# JSON-ready form of the same actions, serialized once on submit
+blue_actions_serialized: deque[dict] = deque(maxlen=settings.MAX_BLUE_ACTIONS_PER_ROUND)
+
+
+# Serializes submit_action: check-then-set on blue_action_this_turn must not interleave
+_action_lock = asyncio.Lock()
+# In-flight background resolutions (strong references; see _resolve_and_broadcast)
+_resolution_tasks: set[asyncio.Task] = set()
+
+# Action IDs only correlate actions within a game: a per-process random prefix plus a counter
+_action_prefix = secrets.token_hex(4)
+_action_seq = itertools.count()
+
+
+# Per-attack vote tallies and the locks that make each vote + majority award atomic
+_investigation_tallies: Dict[str, VoteTally] = {}
+_action_tallies: Dict[str, VoteTally] = {}
+_vote_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _get_tally(tallies: Dict[str, VoteTally], attack_id: str, votes_field: str, completed_field: str) -> VoteTally:
+    """Get (or start) the tally for an attack; game_state exposes the current attack's votes and completion."""
+    tally = tallies.get(attack_id)
+    if tally is None:
+        tally = tallies[attack_id] = VoteTally()
+        setattr(game_state, votes_field, tally.votes)
+        setattr(game_state, completed_field, False)
+    return tally
+
+
+def clear_vote_tallies():
+    """Clear blue team vote tallies for a new game."""
+    _investigation_tallies.clear()
+    _action_tallies.clear()
+    _vote_locks.clear()
+
+
+def clear_blue_actions():
+    """Clear pending blue actions (after a resolution, or for a new round/game)."""
+    blue_actions.clear()
+    blue_actions_serialized.clear()
+
+
+def _correct_investigation_status(attack_info: dict) -> str:
+    """
+    Whether the launched attack actually "succeeded" or was "blocked".
+    
+    Memoized on attack_info; blocked_ips only grows during a game, so its size tells
+    when the answer has to be recomputed.
+    """
+    blocked_count = len(game_state.blocked_ips)
+    cached = attack_info.get("_correct_status")
+    if cached is not None and cached[0] == blocked_count:
+        return cached[1]
+    
+    # Check if attack was resolved and what the result was
+    # If attack was blocked (result == "blocked" or "successful_block"), correct answer is "blocked"
+    # If attack succeeded (result == "hit"), correct answer is "succeeded"
+    correct_status = "blocked"  # Default assumption
+    
+    # Check if attack was resolved by looking at attack_info
+    # The attack_info may have resolution data, or we can check if Blue team blocked the IP
+    # For RCE attacks that were blocked, the correct answer is "blocked"
+    # If the attack source IP was blocked, the attack was likely blocked
+    attack_source_ip = attack_info.get("source_ip")
+    if attack_source_ip and game_state.blocked_ips:
+        if attack_source_ip in game_state.blocked_ips:
+            correct_status = "blocked"
+        else:
+            # IP not blocked, attack may have succeeded
+            correct_status = "succeeded"
     
+    # Also check if attack was resolved with a result
+    # If we have resolution info, use that
+    if "is_blocked" in attack_info and attack_info["is_blocked"]:
+        correct_status = "blocked"
+    elif "result" in attack_info:
+        if attack_info["result"] in ["blocked", "successful_block"]:
+            correct_status = "blocked"
+        elif attack_info["result"] == "hit":
+            correct_status = "succeeded"
+    
+    attack_info["_correct_status"] = (blocked_count, correct_status)
+    return correct_status
+
+
+@router.post("/investigate-attack", response_class=ORJSONResponse)
+async def investigate_attack(request: dict) -> ORJSONResponse:
+    """Submit a vote for whether the attack succeeded or was blocked."""
     player_name = request.get("player_name")
     attack_status = request.get("attack_status")  # "succeeded" or "blocked"
     
@@ -46,206 +176,76 @@ async def investigate_attack(request: dict) -> dict:
         raise HTTPException(status_code=404, detail="Scenario not found")
     
     # Find attack in scenario
-    attack = None
-    for a in scenario.attacks:
-        if a.id == attack_info["attack_id"]:
-            attack = a
-            break
+    attack = scenario.get_attack(attack_info["attack_id"])
     
     if not attack:
         raise HTTPException(status_code=404, detail="Attack not found")
     
     # Determine correct answer based on actual attack resolution outcome
-    # Check if attack was resolved and what the result was
-    # If attack was blocked (result == "blocked" or "successful_block"), correct answer is "blocked"
-    # If attack succeeded (result == "hit"), correct answer is "succeeded"
-    correct_status = "blocked"  # Default assumption
-    
-    # Check if attack was resolved by looking at attack_info
-    # The attack_info may have resolution data, or we can check if Blue team blocked the IP
-    # For RCE attacks that were blocked, the correct answer is "blocked"
-    # If the attack source IP was blocked, the attack was likely blocked
-    attack_source_ip = attack_info.get("source_ip")
-    if attack_source_ip and hasattr(game_state, 'blocked_ips') and game_state.blocked_ips:
-        if attack_source_ip in game_state.blocked_ips:
-            correct_status = "blocked"
-        else:
-            # IP not blocked, attack may have succeeded
-            correct_status = "succeeded"
-    
-    # Also check if attack was resolved with a result
-    # If we have resolution info, use that
-    if "is_blocked" in attack_info and attack_info["is_blocked"]:
-        correct_status = "blocked"
-    elif "result" in attack_info:
-        if attack_info["result"] in ["blocked", "successful_block"]:
-            correct_status = "blocked"
-        elif attack_info["result"] == "hit":
-            correct_status = "succeeded"
+    correct_status = _correct_investigation_status(attack_info)
     
     is_correct = (attack_status == correct_status)
     
-    # Initialize votes dict if needed
-    if not hasattr(game_state, 'blue_investigation_votes') or game_state.blue_investigation_votes is None:
-        game_state.blue_investigation_votes = {}
-    
-    # Store the vote
-    game_state.blue_investigation_votes[player_name] = attack_status
-    
-    # Calculate vote counts
-    vote_counts = {}
-    for status in game_state.blue_investigation_votes.values():
-        vote_counts[status] = vote_counts.get(status, 0) + 1
-    
-    # Determine majority vote
-    total_votes = len(game_state.blue_investigation_votes)
-    majority_status = None
-    majority_count = 0
-    for status, count in vote_counts.items():
-        if count > majority_count:
-            majority_count = count
-            majority_status = status
-    
-    # Check if majority has been reached (more than 50% of votes)
-    has_majority = majority_count > (total_votes / 2) if total_votes > 0 else False
-    majority_is_correct = (majority_status == correct_status) if correct_status and majority_status else False
-    
-    # Award points for correct identification (only once, when majority is reached)
-    identification_points = 0
-    if has_majority and majority_is_correct and not game_state.blue_investigation_completed:
-        identification_points = 5  # Bonus points for correct investigation
-        current_score.blue = max(0, current_score.blue + identification_points)
-        game_state.blue_investigation_completed = True
+    async with _vote_locks.setdefault(attack.id, asyncio.Lock()):
+        # Store the vote (counts are maintained incrementally)
+        # score/vote/turn events go out together in one broadcast, stamped with one timestamp
+        now = datetime.utcnow()
+        pending_events = []
+        tally = _get_tally(_investigation_tallies, attack.id, "blue_investigation_votes", "blue_investigation_completed")
+        tally.cast(player_name, attack_status)
+        
+        vote_counts = dict(tally.counts)
+        total_votes = len(tally.votes)
         
-        # Emit score update
-        score_event = create_event(
-            EventKind.SCORE_UPDATE,
+        # Majority = more than 50% of votes
+        majority_status, has_majority = tally.majority()
+        majority_is_correct = (majority_status == correct_status) if correct_status and majority_status else False
+        
+        # Award points for correct identification (only once per attack; later votes still
+        # update the majority and can end the turn)
+        identification_points = 0
+        if has_majority and majority_is_correct and not tally.completed:
+            identification_points = 5  # Bonus points for correct investigation
+            current_score.blue = max(0, current_score.blue + identification_points)
+            tally.completed = True
+            game_state.blue_investigation_completed = True
+            
+            # Emit score update
+            score_event = create_event(
+                EventKind.SCORE_UPDATE,
+                current_score.snapshot(),
+                server_ts=now,
+            )
+            pending_events.append(score_event)
+        
+        # Emit investigation completed event
+        ident_event = create_event(
+            EventKind.INVESTIGATION_COMPLETED,
             {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
+                "player_name": player_name,
+                "attack_status": attack_status,
+                "is_correct": is_correct,
+                "total_votes": total_votes,
+                "vote_counts": vote_counts,
+                "majority_status": majority_status,
+                "has_majority": has_majority,
+                "majority_is_correct": majority_is_correct,
+                "points_awarded": identification_points,
+                "attack_id": attack.id,
             },
+            server_ts=now,
         )
-        await broadcaster.emit_to_all(score_event)
-        
-        if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(score_event)
-    
-    # Emit investigation completed event
-    ident_event = create_event(
-        EventKind.INVESTIGATION_COMPLETED,
-        {
-            "player_name": player_name,
-            "attack_status": attack_status,
-            "is_correct": is_correct,
-            "total_votes": total_votes,
-            "vote_counts": vote_counts,
-            "votes": game_state.blue_investigation_votes.copy(),
-            "majority_status": majority_status,
-            "has_majority": has_majority,
-            "majority_is_correct": majority_is_correct,
-            "points_awarded": identification_points,
-            "attack_id": attack.id,
-        },
-    )
-    await broadcaster.emit_to_all(ident_event)
-    
-    if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
-        add_event(ident_event)
-    
-    # Switch turn to Red team after Blue team completes Turn 4 (investigation)
-    if has_majority and game_state.current_turn == "blue":
-        # Initialize turn counters if needed
-        if not hasattr(game_state, 'red_turn_count'):
-            game_state.red_turn_count = 0
-        if not hasattr(game_state, 'blue_turn_count'):
-            game_state.blue_turn_count = 0
+        pending_events.append(ident_event)
         
-        # Increment Blue's turn count (Turn 4 complete)
-        game_state.blue_turn_count += 1
-        print(f"[ACTION] Blue team turn count: {game_state.blue_turn_count}")
+        # Switch turn to Red team after Blue team completes Turn 4 (investigation)
+        if has_majority and game_state.current_turn == "blue":
+            pending_events.extend(advance_blue_turn(game_state, "investigation_completed", now))
         
-        # Check if both teams have completed their turns
-        max_turns = getattr(game_state, 'max_turns_per_side', None)
-        if max_turns:
-            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-            red_done = red_turn_count >= max_turns
-            blue_done = blue_turn_count >= max_turns
-            
-            if red_done and blue_done:
-                print(f"[ACTION] Both teams have completed their turns ({max_turns} each). Ending round.")
-                game_state.status = GameStatus.FINISHED
-                
-                # Emit round_ended event
-                end_event = create_event(
-                    EventKind.ROUND_ENDED,
-                    {
-                        "reason": "turn_limit_reached",
-                        "elapsed_seconds": game_state.timer or 0,
-                        "red_turns": red_turn_count,
-                        "blue_turns": blue_turn_count,
-                        "max_turns_per_side": max_turns,
-                    }
-                )
-                await broadcaster.emit_to_all(end_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(end_event)
-            else:
-                # Switch to Red team
-                old_turn = game_state.current_turn
-                game_state.current_turn = "red"
-                game_state.turn_start_time = datetime.utcnow()
-                game_state.red_attack_this_turn = False
-                print(f"[ACTION] Turn changed from {old_turn} to Red after investigation at {game_state.turn_start_time.isoformat()}")
-                
-                # Emit turn_changed event
-                turn_event = create_event(
-                    EventKind.TURN_CHANGED,
-                    {
-                        "turn": "red",
-                        "reason": "investigation_completed",
-                        "previous_turn": old_turn,
-                        "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                    }
-                )
-                print(f"[ACTION] Emitting TURN_CHANGED event: turn=red, reason=investigation_completed")
-                await broadcaster.emit_to_all(turn_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(turn_event)
-        else:
-            # No turn limit, proceed normally
-            old_turn = game_state.current_turn
-            game_state.current_turn = "red"
-            game_state.turn_start_time = datetime.utcnow()
-            game_state.red_attack_this_turn = False
-            print(f"[ACTION] Turn changed from {old_turn} to Red after investigation at {game_state.turn_start_time.isoformat()}")
-            
-            # Emit turn_changed event
-            turn_event = create_event(
-                EventKind.TURN_CHANGED,
-                {
-                    "turn": "red",
-                    "reason": "investigation_completed",
-                    "previous_turn": old_turn,
-                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                }
-            )
-            print(f"[ACTION] Emitting TURN_CHANGED event: turn=red, reason=investigation_completed")
-            await broadcaster.emit_to_all(turn_event)
-            
-            if settings.FEATURE_WS_SNAPSHOT:
-                from app.store import add_event
-                add_event(turn_event)
+        await broadcaster.emit_many_to_all(pending_events)
+        if settings.FEATURE_WS_SNAPSHOT:
+            add_events(pending_events)
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "message": "Investigation vote recorded",
         "is_correct": is_correct,
@@ -256,16 +256,12 @@ async def investigate_attack(request: dict) -> dict:
         "majority_is_correct": majority_is_correct,
         "points_awarded": identification_points,
         "correct_status": correct_status,
-    }
+    })
 
 
-@router.post("/identify-action")
-async def identify_action(request: dict) -> dict:
+@router.post("/identify-action", response_class=ORJSONResponse)
+async def identify_action(request: dict) -> ORJSONResponse:
     """Submit a vote for which action to take in response to an attack."""
-    from app.routes.score import current_score
-    from app.routes.attacks import launched_attacks
-    from app.routes.scenarios import scenarios_cache
-    
     player_name = request.get("player_name")
     action_type = request.get("action_type")  # The action type they think is correct
     
@@ -289,107 +285,73 @@ async def identify_action(request: dict) -> dict:
         raise HTTPException(status_code=404, detail="Scenario not found")
     
     # Find attack in scenario
-    attack = None
-    for a in scenario.attacks:
-        if a.id == attack_info["attack_id"]:
-            attack = a
-            break
+    attack = scenario.get_attack(attack_info["attack_id"])
     
     if not attack:
         raise HTTPException(status_code=404, detail="Attack not found")
     
     # Determine correct action based on attack type
-    # For RCE attacks: UPDATE_WAF is optimal (pre-exploitation)
-    # For SQLI attacks: UPDATE_WAF is optimal
-    # For network attacks: BLOCK_IP is optimal
-    # For brute force: BLOCK_IP or UPDATE_WAF
-    correct_action = None
-    if attack.attack_type.value == "RCE":
-        correct_action = "update_waf"  # Optimal for pre-exploitation RCE
-    elif attack.attack_type.value == "SQLI":
-        correct_action = "update_waf"
-    elif attack.attack_type.value == "LATERALMOVE":
-        correct_action = "block_ip"
-    elif attack.attack_type.value == "BRUTEFORCE":
-        correct_action = "block_ip"
-    else:
-        correct_action = "block_ip"  # Default
+    correct_action = CORRECT_ACTION_BY_TYPE.get(attack.attack_type.value, "block_ip")
     
     is_correct = (action_type == correct_action)
     
-    # Initialize votes dict if needed
-    if not hasattr(game_state, 'blue_action_votes') or game_state.blue_action_votes is None:
-        game_state.blue_action_votes = {}
-    
-    # Store the vote
-    game_state.blue_action_votes[player_name] = action_type
-    
-    # Calculate vote counts
-    vote_counts = {}
-    for action in game_state.blue_action_votes.values():
-        vote_counts[action] = vote_counts.get(action, 0) + 1
-    
-    # Determine majority vote
-    total_votes = len(game_state.blue_action_votes)
-    majority_action = None
-    majority_count = 0
-    for action, count in vote_counts.items():
-        if count > majority_count:
-            majority_count = count
-            majority_action = action
-    
-    # Check if majority has been reached (more than 50% of votes)
-    has_majority = majority_count > (total_votes / 2) if total_votes > 0 else False
-    majority_is_correct = (majority_action == correct_action) if correct_action and majority_action else False
-    
-    # Award points for correct identification (only once, when majority is reached)
-    identification_points = 0
-    if has_majority and majority_is_correct and not game_state.blue_action_identified:
-        identification_points = 5  # Bonus points for correct team identification
-        current_score.blue = max(0, current_score.blue + identification_points)
-        game_state.blue_action_identified = True
+    async with _vote_locks.setdefault(attack.id, asyncio.Lock()):
+        # Store the vote (counts are maintained incrementally)
+        # score/vote/turn events go out together in one broadcast, stamped with one timestamp
+        now = datetime.utcnow()
+        pending_events = []
+        tally = _get_tally(_action_tallies, attack.id, "blue_action_votes", "blue_action_identified")
+        tally.cast(player_name, action_type)
+        
+        vote_counts = dict(tally.counts)
+        total_votes = len(tally.votes)
+        
+        # Majority = more than 50% of votes
+        majority_action, has_majority = tally.majority()
+        majority_is_correct = (majority_action == correct_action) if correct_action and majority_action else False
+        
+        # Award points for correct identification (only once per attack; later votes still
+        # update the majority)
+        identification_points = 0
+        if has_majority and majority_is_correct and not tally.completed:
+            identification_points = 5  # Bonus points for correct team identification
+            current_score.blue = max(0, current_score.blue + identification_points)
+            tally.completed = True
+            game_state.blue_action_identified = True
+            
+            # Emit score update
+            score_event = create_event(
+                EventKind.SCORE_UPDATE,
+                current_score.snapshot(),
+                server_ts=now,
+            )
+            pending_events.append(score_event)
         
-        # Emit score update
-        score_event = create_event(
-            EventKind.SCORE_UPDATE,
+        # Emit action identification event
+        ident_event = create_event(
+            EventKind.ACTION_IDENTIFIED,
             {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
+                "player_name": player_name,
+                "action_type": action_type,
+                "is_correct": is_correct,
+                "total_votes": total_votes,
+                "vote_counts": vote_counts,
+                "majority_action": majority_action,
+                "has_majority": has_majority,
+                "majority_is_correct": majority_is_correct,
+                "points_awarded": identification_points,
+                "attack_id": attack.id,
+                "attack_type": attack.attack_type.value,
             },
+            server_ts=now,
         )
-        await broadcaster.emit_to_all(score_event)
+        pending_events.append(ident_event)
         
+        await broadcaster.emit_many_to_all(pending_events)
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(score_event)
-    
-    # Emit action identification event
-    ident_event = create_event(
-        EventKind.ACTION_IDENTIFIED,
-        {
-            "player_name": player_name,
-            "action_type": action_type,
-            "is_correct": is_correct,
-            "total_votes": total_votes,
-            "vote_counts": vote_counts,
-            "votes": game_state.blue_action_votes.copy(),  # Full votes dict (player_name -> action_type)
-            "majority_action": majority_action,
-            "has_majority": has_majority,
-            "majority_is_correct": majority_is_correct,
-            "points_awarded": identification_points,
-            "attack_id": attack.id,
-            "attack_type": attack.attack_type.value,
-        },
-    )
-    await broadcaster.emit_to_all(ident_event)
-    
-    if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
-        add_event(ident_event)
+            add_events(pending_events)
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "message": "Vote recorded",
         "is_correct": is_correct,
@@ -400,17 +362,24 @@ async def identify_action(request: dict) -> dict:
         "majority_is_correct": majority_is_correct,
         "points_awarded": identification_points,
         "correct_action": correct_action,
-    }
+    })
 
 
-@router.post("")
-async def submit_action(request: ActionRequest):
+@router.post("", response_class=ORJSONResponse)
+async def submit_action(request: ActionRequest) -> ORJSONResponse:
     """Submit a blue team action."""
+    # A concurrent duplicate waits here, then fails the blue_action_this_turn check
+    async with _action_lock:
+        return await _submit_action(request)
+
+
+async def _submit_action(request: ActionRequest) -> ORJSONResponse:
+    """Validate, record and resolve a blue team action (caller holds _action_lock)."""
     global game_state, blue_actions
     
     try:
-        print(f"[ACTION] Submit request: type={request.type}, target={request.target}")
-        print(f"[ACTION] Game state: status={game_state.status}, scenario={game_state.current_scenario_id}, turn={game_state.current_turn}")
+        logger.debug("[ACTION] Submit request: type=%s, target=%s", request.type, request.target)
+        logger.debug("[ACTION] Game state: status=%s, scenario=%s, turn=%s", game_state.status, game_state.current_scenario_id, game_state.current_turn)
         
         if game_state.status != GameStatus.RUNNING:
             raise HTTPException(
@@ -420,7 +389,7 @@ async def submit_action(request: ActionRequest):
         
         # Check if it's Blue team's turn
         if game_state.current_turn != "blue":
-            print(f"[ACTION] Error: Not Blue team's turn. Current turn: {game_state.current_turn}")
+            logger.debug("[ACTION] Error: Not Blue team's turn. Current turn: %s", game_state.current_turn)
             raise HTTPException(
                 status_code=403,
                 detail=f"It's not Blue team's turn. Current turn: {game_state.current_turn}. Please wait for your turn."
@@ -437,23 +406,24 @@ async def submit_action(request: ActionRequest):
         raise
     except Exception as e:
         # Catch any other exceptions and return 500 with detailed error
-        print(f"[ACTION] Unexpected error in submit_action validation: {e}")
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[ACTION] Full traceback:\n{error_trace}")
+        logger.exception("[ACTION] Unexpected error in submit_action validation")
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}. Check server logs for details."
         )
     
+    # score/action/turn events go out together in one broadcast, stamped with one timestamp
+    now = datetime.utcnow()
+    pending_events = []
+    
     try:
         action = BlueAction(
-            id=str(uuid.uuid4()),
+            id=f"{_action_prefix}-{next(_action_seq):x}",
             actor="blue",
             type=request.type,
             target=request.target,
             note=request.note,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             player_name=request.player_name,
         )
         
@@ -462,315 +432,187 @@ async def submit_action(request: ActionRequest):
         
         # Handle IP blocking
         if action.type == "block_ip":
-            # Initialize blocked IPs list if needed
-            if not hasattr(game_state, 'blocked_ips') or game_state.blocked_ips is None:
-                game_state.blocked_ips = []
-            if not hasattr(game_state, 'red_scan_ips') or game_state.red_scan_ips is None:
-                game_state.red_scan_ips = []
-            
-            # Add IP to blocked list if not already blocked
+            # Add IP to blocked set (no-op if already blocked)
             blocked_ip = action.target
-            if blocked_ip not in game_state.blocked_ips:
-                game_state.blocked_ips.append(blocked_ip)
-                print(f"[ACTION] IP {blocked_ip} added to blocked list. Total blocked IPs: {len(game_state.blocked_ips)}")
+            game_state.blocked_ips.add(blocked_ip)
+            logger.debug("[ACTION] IP %s blocked. Total blocked IPs: %s", blocked_ip, len(game_state.blocked_ips))
             
             # Check if blocked IP matches a scan IP (for scoring)
             if blocked_ip in game_state.red_scan_ips:
-                print(f"[ACTION] Blocked IP {blocked_ip} matches a scan IP. Blue team correctly identified scan source.")
+                logger.debug("[ACTION] Blocked IP %s matches a scan IP. Blue team correctly identified scan source.", blocked_ip)
                 # Award bonus points for correctly identifying scan IP
-                from app.routes.score import current_score
                 current_score.blue = max(0, current_score.blue + 3)  # Bonus for identifying scan IP
                 
                 # Emit score update
                 score_event = create_event(
                     EventKind.SCORE_UPDATE,
-                    {
-                        "red": current_score.red,
-                        "blue": current_score.blue,
-                        "mttd": current_score.mttd,
-                        "mttc": current_score.mttc,
-                    },
+                    current_score.snapshot(),
+                    server_ts=now,
                 )
-                await broadcaster.emit_to_all(score_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(score_event)
+                pending_events.append(score_event)
         
         blue_actions.append(action)
+        # mode="json" converts the timestamp to an ISO string during the dump
+        action_payload = action.model_dump(mode="json")
+        blue_actions_serialized.append(action_payload)
     except Exception as e:
-        print(f"[ACTION] Error creating action: {e}")
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[ACTION] Full traceback:\n{error_trace}")
+        logger.exception("[ACTION] Error creating action")
         raise HTTPException(
             status_code=500,
             detail=f"Error creating action: {str(e)}. Check server logs for details."
         )
     
     # Emit action_taken event to all (so timeline shows it for all roles)
-    # Include action effectiveness context if available
-    action_payload = action.model_dump()
-    # Ensure timestamp is serialized as ISO string
-    if isinstance(action_payload.get("timestamp"), datetime):
-        action_payload["timestamp"] = action_payload["timestamp"].isoformat()
-    
     event = create_event(
         EventKind.ACTION_TAKEN,
         action_payload,
+        server_ts=now,
     )
-    await broadcaster.emit_to_all(event)
-    
-    # Store event if snapshot feature is enabled
-    if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
-        add_event(event)
+    pending_events.append(event)
     
-    print(f"[ACTION] Emitted action_taken event: {action.id}, type: {action.type}, target: {action.target}")
+    logger.debug("[ACTION] Queued action_taken event: %s, type: %s, target: %s", action.id, action.type, action.target)
     
     # Debug: Log launched_attacks status
-    print(f"[ACTION] Checking for active attacks. launched_attacks count: {len(launched_attacks)}")
-    if launched_attacks:
-        print(f"[ACTION] Found {len(launched_attacks)} active attack(s). Most recent: {launched_attacks[-1].get('attack_id', 'unknown')}")
-    else:
-        print(f"[ACTION] No active attacks found. Action submitted but cannot resolve any attack.")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[ACTION] Checking for active attacks. launched_attacks count: %s", len(launched_attacks))
+        if launched_attacks:
+            logger.debug("[ACTION] Found %s active attack(s). Most recent: %s", len(launched_attacks), launched_attacks[-1].get('attack_id', 'unknown'))
+        else:
+            logger.debug("[ACTION] No active attacks found. Action submitted but cannot resolve any attack.")
     
     # If no active attack, handle turn switching for defensive actions (like IP blocking)
     if not launched_attacks:
         # For Turn 2, Blue team should identify and block scan IPs
         # After blocking IP (or other defensive actions), switch turn to Red
-        old_turn = game_state.current_turn
         if game_state.current_turn == "blue":
-            # Initialize turn counters if needed
-            if not hasattr(game_state, 'red_turn_count'):
-                game_state.red_turn_count = 0
-            if not hasattr(game_state, 'blue_turn_count'):
-                game_state.blue_turn_count = 0
-            
-            # Increment Blue's turn counter
-            game_state.blue_turn_count += 1
-            print(f"[ACTION] Blue team turn count: {game_state.blue_turn_count}")
-            
-            # Check if both teams have completed their turns
-            max_turns = getattr(game_state, 'max_turns_per_side', None)
-            if max_turns:
-                red_turn_count = getattr(game_state, 'red_turn_count', 0)
-                blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-                red_done = red_turn_count >= max_turns
-                blue_done = blue_turn_count >= max_turns
-                
-                if red_done and blue_done:
-                    print(f"[ACTION] Both teams have completed their turns ({max_turns} each). Ending round.")
-                    game_state.status = GameStatus.FINISHED
-                    
-                    # Emit round_ended event
-                    end_event = create_event(
-                        EventKind.ROUND_ENDED,
-                        {
-                            "reason": "turn_limit_reached",
-                            "elapsed_seconds": game_state.timer or 0,
-                            "red_turns": red_turn_count,
-                            "blue_turns": blue_turn_count,
-                            "max_turns_per_side": max_turns,
-                        }
-                    )
-                    await broadcaster.emit_to_all(end_event)
-                    
-                    if settings.FEATURE_WS_SNAPSHOT:
-                        from app.store import add_event
-                        add_event(end_event)
-                else:
-                    # Switch to Red team
-                    game_state.current_turn = "red"
-                    game_state.turn_start_time = datetime.utcnow()
-                    game_state.red_attack_this_turn = False
-                    print(f"[ACTION] Turn changed from {old_turn} to Red after blue action (no active attack) at {game_state.turn_start_time.isoformat()}")
-                    
-                    # Emit turn_changed event
-                    turn_event = create_event(
-                        EventKind.TURN_CHANGED,
-                        {
-                            "turn": "red",
-                            "reason": "blue_action_taken",
-                            "previous_turn": old_turn,
-                            "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                        }
-                    )
-                    print(f"[ACTION] Emitting TURN_CHANGED event: turn=red, reason=blue_action_taken")
-                    await broadcaster.emit_to_all(turn_event)
-                    
-                    if settings.FEATURE_WS_SNAPSHOT:
-                        from app.store import add_event
-                        add_event(turn_event)
-            else:
-                # No turn limit, proceed normally
-                game_state.current_turn = "red"
-                game_state.turn_start_time = datetime.utcnow()
-                game_state.red_attack_this_turn = False
-                print(f"[ACTION] Turn changed from {old_turn} to Red after blue action (no active attack) at {game_state.turn_start_time.isoformat()}")
-                
-                # Emit turn_changed event
-                turn_event = create_event(
-                    EventKind.TURN_CHANGED,
-                    {
-                        "turn": "red",
-                        "reason": "blue_action_taken",
-                        "previous_turn": old_turn,
-                        "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                    }
-                )
-                print(f"[ACTION] Emitting TURN_CHANGED event: turn=red, reason=blue_action_taken")
-                await broadcaster.emit_to_all(turn_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(turn_event)
+            pending_events.extend(advance_blue_turn(game_state, "blue_action_taken", now))
         
-        return {"status": "acknowledged", "action_id": action.id}
+        await broadcaster.emit_many_to_all(pending_events)
+        if settings.FEATURE_WS_SNAPSHOT:
+            add_events(pending_events)
+        
+        return ORJSONResponse({"status": "acknowledged", "action_id": action.id})
+    
+    await broadcaster.emit_many_to_all(pending_events)
+    if settings.FEATURE_WS_SNAPSHOT:
+        add_events(pending_events)
     
-    # If we have an active attack, resolve final outcome
+    # Resolve the most recent attack in the background; clients learn the outcome over the websocket
     # This is simplified - in full implementation, track active attacks
-    if launched_attacks:
-        # Get the most recent attack
-        attack_info = launched_attacks[-1]
+    task = asyncio.create_task(
+        _resolve_and_broadcast(launched_attacks[-1], list(blue_actions), list(blue_actions_serialized))
+    )
+    # Keep a reference so the task is not garbage-collected mid-flight
+    _resolution_tasks.add(task)
+    task.add_done_callback(_resolution_tasks.discard)
+    
+    return ORJSONResponse({"status": "acknowledged", "action_id": action.id})
+
+
+async def _resolve_and_broadcast(attack_info: dict, actions: List[BlueAction], actions_serialized: List[dict]):
+    """
+    Resolve an attack against the round's blue actions and broadcast the outcome.
+    
+    Runs as a task scheduled by submit_action; takes _action_lock so the next
+    submission sees the turn change made here.
+    """
+    async with _action_lock:
+        # Response time from the monotonic clock; one wall-clock read for the turn change
+        elapsed = time.perf_counter() - attack_info["launch_monotonic"]
+        now = datetime.utcnow()
         scenario = scenarios_cache.get(game_state.current_scenario_id)
         
         if scenario:
             # Find attack in scenario
-            attack = None
-            for a in scenario.attacks:
-                if a.id == attack_info["attack_id"]:
-                    attack = a
-                    break
+            attack = scenario.get_attack(attack_info["attack_id"])
             
             if attack:
-                print(f"[ACTION] Resolving attack {attack.id} with {len(blue_actions)} blue actions")
-                print(f"[ACTION] Attack details: type={attack.attack_type}, from={attack.from_node}, to={attack.to_node}")
-                for i, action in enumerate(blue_actions):
-                    print(f"[ACTION] Blue action {i}: type={action.type}, target={action.target}, note={action.note}")
-                
-                # Get alerts from attack launch (for tiered resolution)
-                alerts = attack_info.get("alerts", [])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[ACTION] Resolving attack %s with %s blue actions", attack.id, len(actions))
+                    logger.debug("[ACTION] Attack details: type=%s, from=%s, to=%s", attack.attack_type, attack.from_node, attack.to_node)
+                    for i, action in enumerate(actions):
+                        logger.debug("[ACTION] Blue action %s: type=%s, target=%s, note=%s", i, action.type, action.target, action.note)
                 
                 try:
+                    # Alerts from the attack launch feed tiered resolution
                     outcome = resolve_outcome(
                         attack,
-                        blue_actions,
+                        actions,
                         scenario.initial_posture,
-                        (datetime.utcnow() - attack_info["timestamp"]).total_seconds(),
-                        alerts=alerts,
-                    )
-                except Exception as e:
-                    print(f"[ACTION] Error resolving outcome: {e}")
-                    import traceback
-                    error_trace = traceback.format_exc()
-                    print(f"[ACTION] Full traceback:\n{error_trace}")
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Error resolving attack outcome: {str(e)}. Check server logs for details."
+                        elapsed,
+                        alerts=attack_info.get("alerts", []),
                     )
+                except Exception:
+                    # The action was already acknowledged; still hand the turn back so the game doesn't stall
+                    logger.exception("[ACTION] Error resolving outcome")
+                    if game_state.current_turn == "blue":
+                        turn_events = advance_blue_turn(game_state, "blue_action_taken", now)
+                        await broadcaster.emit_many_to_all(turn_events)
+                        if settings.FEATURE_WS_SNAPSHOT:
+                            add_events(turn_events)
+                    clear_blue_actions()
+                    return
                 
-                print(f"[ACTION] Resolution outcome: {outcome}")
+                logger.debug("[ACTION] Resolution outcome: %s", outcome)
+                attack_type = attack.attack_type.value
                 
                 # Calculate score explanation
-                score_explanation = []
+                reasons = 0
                 if outcome["result"] == "blocked":
-                    score_explanation.append("Blocked attack (+8)")
-                if outcome["result"] != "hit" and len(blue_actions) > 0:
-                    time_diff = (datetime.utcnow() - attack_info["timestamp"]).total_seconds()
-                    if time_diff < 300:  # 5 minutes
-                        score_explanation.append("Quick response (+5)")
-                # Attribution check
-                for action in blue_actions:
+                    reasons |= _REASON_BLOCKED
+                # Responded within 5 minutes of launch (also reported in effectiveness below)
+                quick_response = bool(actions) and elapsed < 300
+                if outcome["result"] != "hit" and quick_response:
+                    reasons |= _REASON_QUICK
+                # Attribution check in one pass over the actions (also reported in effectiveness below)
+                attribution = attribution_pattern(attack_type)
+                has_notes = correct_attribution = False
+                for action in actions:
                     if action.note:
-                        note_lower = action.note.lower()
-                        attack_type_lower = attack.attack_type.value.lower()
-                        if any(term in note_lower for term in [attack_type_lower, "attack", "rce", "sqli", "sql", "brute", "phish", "lateral", "exfil"]):
-                            score_explanation.append("Correct attribution (+2)")
-                            break
-                        else:
-                            score_explanation.append("Wrong attribution (-1)")
+                        has_notes = True
+                        if attribution.search(action.note):
+                            correct_attribution = True
                             break
+                if has_notes:
+                    reasons |= _REASON_CORRECT_ATTRIBUTION if correct_attribution else _REASON_WRONG_ATTRIBUTION
                 
                 # Emit updated attack_resolved event with final result
-                print(f"[ACTION] Resolving attack {attack.id}: result={outcome['result']}, blue_score={outcome['score_deltas']['blue']}, red_score={outcome['score_deltas']['red']}")
+                logger.debug("[ACTION] Resolving attack %s: result=%s, blue_score=%s, red_score=%s", attack.id, outcome['result'], outcome['score_deltas']['blue'], outcome['score_deltas']['red'])
                 
                 # Include tiered resolution data if available
-                # Serialize blue actions (convert datetime to ISO string)
-                blue_actions_serialized = []
-                for a in blue_actions:
-                    action_dict = a.model_dump()
-                    if isinstance(action_dict.get("timestamp"), datetime):
-                        action_dict["timestamp"] = action_dict["timestamp"].isoformat()
-                    blue_actions_serialized.append(action_dict)
-                
                 resolve_payload = {
                     "attack_id": attack.id,
-                    "attack_type": attack.attack_type.value,
+                    "attack_type": attack_type,
                     "from": attack.from_node,  # Include from/to for map display
                     "to": attack.to_node,
                     "result": outcome["result"],
                     "preliminary": False,  # This is the final resolution
-                    "blue_actions_count": len(blue_actions),
-                    "blue_actions": blue_actions_serialized,  # Include action details (serialized)
+                    "blue_actions_count": len(actions),
+                    "blue_actions": actions_serialized,  # Only actions new since the last resolution; earlier ones were already sent
                     "score_deltas": outcome["score_deltas"],
-                    "score_explanation": ", ".join(score_explanation) if score_explanation else "No score change",
+                    "score_explanation": _score_explanation(reasons),
                 }
                 
-                # Add tiered resolution fields if available
-                if "attack_succeeded" in outcome:
-                    resolve_payload["attack_succeeded"] = outcome["attack_succeeded"]
-                if "success_indicators" in outcome:
-                    resolve_payload["success_indicators"] = outcome["success_indicators"]
-                if "action_evaluations" in outcome:
-                    # Serialize action_evaluations (may contain datetime objects)
-                    action_evaluations_serialized = []
-                    for eval_item in outcome["action_evaluations"]:
-                        eval_dict = eval_item.copy() if isinstance(eval_item, dict) else eval_item.model_dump() if hasattr(eval_item, 'model_dump') else eval_item
-                        # Convert any datetime objects to ISO strings
-                        for key, value in eval_dict.items():
-                            if isinstance(value, datetime):
-                                eval_dict[key] = value.isoformat()
-                        action_evaluations_serialized.append(eval_dict)
-                    resolve_payload["action_evaluations"] = action_evaluations_serialized
-                
-                # Serialize emitted_alerts if present (contains datetime objects in timestamps)
-                if "emitted_alerts" in outcome:
-                    alerts_serialized = []
-                    for alert in outcome["emitted_alerts"]:
-                        alert_dict = alert.copy() if isinstance(alert, dict) else alert.model_dump() if hasattr(alert, 'model_dump') else alert
-                        # Convert datetime timestamp to ISO string
-                        if isinstance(alert_dict.get("timestamp"), datetime):
-                            alert_dict["timestamp"] = alert_dict["timestamp"].isoformat()
-                        alerts_serialized.append(alert_dict)
-                    resolve_payload["emitted_alerts"] = alerts_serialized
+                # Add tiered resolution fields if available (the resolver already dumped them with mode="json")
+                resolve_payload.update({key: outcome[key] for key in _OUTCOME_PASSTHROUGH_KEYS if key in outcome})
                 
                 # Legacy effectiveness field (for backward compatibility)
                 resolve_payload["effectiveness"] = {
-                    "blocked": outcome["result"] in ["successful_block", "blocked"],
+                    "blocked": outcome["result"] in _BLOCKED_RESULTS,
                     "detected": outcome["result"] != "hit",
-                    "quick_response": len(blue_actions) > 0 and (datetime.utcnow() - attack_info["timestamp"]).total_seconds() < 300,
-                    "correct_attribution": any(
-                        action.note and any(term in action.note.lower() for term in [attack.attack_type.value.lower(), "rce", "sqli", "sql", "brute", "phish", "lateral", "exfil"])
-                        for action in blue_actions
-                    ),
+                    "quick_response": quick_response,
+                    "correct_attribution": correct_attribution,
                 }
                 
                 resolve_event = create_event(
                     EventKind.ATTACK_RESOLVED,
                     resolve_payload,
+                    server_ts=now,
                 )
-                await broadcaster.emit_to_all(resolve_event)
-                
-                # Store event if snapshot feature is enabled
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(resolve_event)
+                # resolve/score/turn (or round-end) events go out together in one broadcast
+                pending_events = [resolve_event]
                 
                 # Update score (simplified - in full implementation, maintain score state)
-                # Import score module
-                from app.routes.score import current_score
-                
                 # Update cumulative score (ensure non-negative)
                 current_score.red = max(0, current_score.red + outcome["score_deltas"]["red"])
                 current_score.blue = max(0, current_score.blue + outcome["score_deltas"]["blue"])
@@ -778,117 +620,23 @@ async def submit_action(request: ActionRequest):
                 # Emit score_update event with current cumulative score
                 score_event = create_event(
                     EventKind.SCORE_UPDATE,
-                    {
-                        "red": current_score.red,
-                        "blue": current_score.blue,
-                        "mttd": current_score.mttd,
-                        "mttc": current_score.mttc,
-                    },
+                    current_score.snapshot(),
+                    server_ts=now,
                 )
-                await broadcaster.emit_to_all(score_event)
-                
-                # Store event if snapshot feature is enabled
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(score_event)
+                pending_events.append(score_event)
                 
                 # Change turn back to Red after Blue action
-                old_turn = game_state.current_turn
                 if game_state.current_turn == "blue":
-                    # Initialize turn counters if they don't exist (defensive check for backwards compatibility)
-                    if not hasattr(game_state, 'red_turn_count'):
-                        game_state.red_turn_count = 0
-                    if not hasattr(game_state, 'blue_turn_count'):
-                        game_state.blue_turn_count = 0
-                    
-                    # Increment Blue's turn counter
-                    game_state.blue_turn_count += 1
-                    print(f"[ACTION] Blue team turn count: {game_state.blue_turn_count}")
-                    
-                    # Check if both teams have completed their turns
-                    max_turns = getattr(game_state, 'max_turns_per_side', None)
-                    if max_turns:
-                        red_turn_count = getattr(game_state, 'red_turn_count', 0)
-                        blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-                        red_done = red_turn_count >= max_turns
-                        blue_done = blue_turn_count >= max_turns
-                        
-                        if red_done and blue_done:
-                            print(f"[ACTION] Both teams have completed their turns ({max_turns} each). Ending round.")
-                            game_state.status = GameStatus.FINISHED
-                            
-                            # Emit round_ended event
-                            end_event = create_event(
-                                EventKind.ROUND_ENDED,
-                                {
-                                    "reason": "turn_limit_reached",
-                                    "elapsed_seconds": game_state.timer or 0,
-                                    "red_turns": red_turn_count,
-                                    "blue_turns": blue_turn_count,
-                                    "max_turns_per_side": max_turns,
-                                }
-                            )
-                            await broadcaster.emit_to_all(end_event)
-                            
-                            if settings.FEATURE_WS_SNAPSHOT:
-                                from app.store import add_event
-                                add_event(end_event)
-                            
-                            # Don't advance turn, game is over
-                        else:
-                            # Continue with turn change
-                            game_state.current_turn = "red"
-                            game_state.turn_start_time = datetime.utcnow()  # Start Red's turn timer
-                            # Reset Red's action limits for the new turn
-                            # Note: Removed red_scan_this_turn reset - scans no longer restricted by turn
-                            game_state.red_attack_this_turn = False
-                            print(f"[ACTION] Turn changed from {old_turn} to Red after blue action at {game_state.turn_start_time.isoformat()}")
-                            
-                            # Emit turn_changed event
-                            turn_event = create_event(
-                                EventKind.TURN_CHANGED,
-                                {
-                                    "turn": "red",
-                                    "reason": "blue_action_taken",
-                                    "previous_turn": old_turn,
-                                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                                }
-                            )
-                            print(f"[ACTION] Emitting TURN_CHANGED event: turn=red, reason=blue_action_taken")
-                            await broadcaster.emit_to_all(turn_event)
-                            
-                            # Store event if snapshot feature is enabled
-                            if settings.FEATURE_WS_SNAPSHOT:
-                                from app.store import add_event
-                                add_event(turn_event)
-                    else:
-                        # No turn limit, proceed normally
-                        game_state.current_turn = "red"
-                        game_state.turn_start_time = datetime.utcnow()  # Start Red's turn timer
-                        # Reset Red's action limits for the new turn
-                        # Note: Removed red_scan_this_turn reset - scans no longer restricted by turn
-                        game_state.red_attack_this_turn = False
-                        print(f"[ACTION] Turn changed from {old_turn} to Red after blue action at {game_state.turn_start_time.isoformat()}")
-                        
-                        # Emit turn_changed event
-                        turn_event = create_event(
-                            EventKind.TURN_CHANGED,
-                            {
-                                "turn": "red",
-                                "reason": "blue_action_taken",
-                                "previous_turn": old_turn,
-                                "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                            }
-                        )
-                        print(f"[ACTION] Emitting TURN_CHANGED event: turn=red, reason=blue_action_taken")
-                        await broadcaster.emit_to_all(turn_event)
-                        
-                        # Store event if snapshot feature is enabled
-                        if settings.FEATURE_WS_SNAPSHOT:
-                            from app.store import add_event
-                            add_event(turn_event)
+                    pending_events.extend(advance_blue_turn(game_state, "blue_action_taken", now))
                 else:
-                    print(f"[ACTION] WARNING: Turn is already {game_state.current_turn}, not changing to Red")
+                    logger.warning("[ACTION] Turn is already %s, not changing to Red", game_state.current_turn)
                 
-    return {"status": "acknowledged", "action_id": action.id}
-
+                await broadcaster.emit_many_to_all(pending_events)
+                
+                # Store events if snapshot feature is enabled
+                if settings.FEATURE_WS_SNAPSHOT:
+                    add_events(pending_events)
+                
+                # These actions have been scored against (and reported for) this attack; the next
+                # attack starts fresh even if the turn didn't pass to Red (timeout, round end)
+                clear_blue_actions()
@@ -1,25 +1,30 @@
 """Activity tracking routes."""
 from fastapi import APIRouter, HTTPException
-from app.models import ActivityRequest, ActivityEvent, GameStatus
+from fastapi.responses import ORJSONResponse
+from app.models import ActivityRequest, ActivityEvent, EventKind, GameStatus
 from app.routes.game import game_state
 from app.ws import broadcaster, create_event
 from app.settings import settings
+from collections import deque
+from dataclasses import fields
 from datetime import datetime
+from itertools import islice
 import uuid
 
 router = APIRouter(prefix="/api/activity", tags=["activity"])
 
-# Store recent activities (last 50 per role)
-_activity_history: dict[str, list[ActivityEvent]] = {
-    "red": [],
-    "blue": [],
-    "gm": [],
-    "audience": [],
+# Store recent activities (last 50 per role; older ones fall off the ring buffer)
+MAX_ACTIVITIES_PER_ROLE = 50
+_activity_history: dict[str, deque[ActivityEvent]] = {
+    role: deque(maxlen=MAX_ACTIVITIES_PER_ROLE) for role in ("red", "blue", "gm", "audience")
 }
 
+# ActivityEvent fields copied into the broadcast payload (shallow: metadata is shared, not deep-copied)
+_ACTIVITY_FIELDS = tuple(f.name for f in fields(ActivityEvent))
 
-@router.post("/track")
-async def track_activity(request: ActivityRequest) -> dict:
+
+@router.post("/track", response_class=ORJSONResponse)
+async def track_activity(request: ActivityRequest) -> ORJSONResponse:
     """Track a player activity."""
     if game_state.status != GameStatus.RUNNING and game_state.status != GameStatus.PAUSED:
         # Allow activity tracking even when game is not running (for presence)
@@ -37,64 +42,38 @@ async def track_activity(request: ActivityRequest) -> dict:
     )
     
     # Add to history
-    if request.role in _activity_history:
-        _activity_history[request.role].append(activity)
-        # Keep only last 50 activities
-        _activity_history[request.role] = _activity_history[request.role][-50:]
-    
-    # Emit activity event to team room
-    from app.models import EventKind
-    activity_event = create_event(
-        EventKind.ACTIVITY_EVENT,
-        {
-            "id": activity.id,
-            "player_name": activity.player_name,
-            "role": activity.role,
-            "activity_type": activity.activity_type,
-            "description": activity.description,
-            "timestamp": activity.timestamp.isoformat(),
-            "metadata": activity.metadata,
-        },
-    )
+    history = _activity_history.get(request.role)
+    if history is not None:
+        history.append(activity)
     
-    # Emit to role-specific room
-    await broadcaster.emit_to_role(request.role, activity_event)
+    # Emit activity event to team room, only if someone is there to see it
+    # (the timestamp is converted when the event is serialized)
+    if broadcaster.has_subscribers(request.role):
+        activity_event = create_event(
+            EventKind.ACTIVITY_EVENT,
+            {name: getattr(activity, name) for name in _ACTIVITY_FIELDS},
+        )
+        await broadcaster.emit_to_role(request.role, activity_event)
     
-    return {"success": True, "activity_id": activity.id}
+    return ORJSONResponse({"success": True, "activity_id": activity.id})
 
 
-@router.get("/recent")
-async def get_recent_activities(role: str, limit: int = 20) -> dict:
+@router.get("/recent", response_class=ORJSONResponse)
+async def get_recent_activities(role: str, limit: int = 20) -> ORJSONResponse:
     """Get recent activities for a role."""
-    if role not in ["red", "blue", "gm", "audience"]:
+    history = _activity_history.get(role)
+    if history is None:
         raise HTTPException(status_code=400, detail="Invalid role")
     
-    activities = _activity_history.get(role, [])[-limit:]
-    # Convert to JSON-serializable format
-    return {
+    activities = islice(history, max(0, len(history) - limit), None)
+    # orjson encodes the timestamps natively; no per-field isoformat pass
+    return ORJSONResponse({
         "role": role,
-        "activities": [
-            {
-                "id": act.id,
-                "player_name": act.player_name,
-                "role": act.role,
-                "activity_type": act.activity_type,
-                "description": act.description,
-                "timestamp": act.timestamp.isoformat(),
-                "metadata": act.metadata,
-            }
-            for act in activities
-        ],
-    }
+        "activities": list(activities),
+    })
 
 
 def clear_activity_history():
     """Clear activity history (called on game reset)."""
-    global _activity_history
-    _activity_history = {
-        "red": [],
-        "blue": [],
-        "gm": [],
-        "audience": [],
-    }
-
+    for history in _activity_history.values():
+        history.clear()
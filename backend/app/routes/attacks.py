@@ -1,20 +1,19 @@
 """Attack launch routes."""
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from app.models import AttackLaunchRequest, Event, EventKind, GameStatus
 from app.services.resolver import resolve_outcome
 from app.services.alerts import generate_alerts
+from app.services.source_ip import random_source_ip
+from app.services.turn import advance_red_turn
 from app.ws import broadcaster, create_event
 from app.settings import settings
+from app.store import add_events
 from app.routes import game
 from app.routes.scenarios import scenarios_cache
+from app.routes.score import current_score
 from datetime import datetime
-import random
-# Import at module level to avoid circular imports
-try:
-    from app.routes.score import current_score
-except ImportError:
-    # Fallback if score module not loaded yet
-    current_score = None
+import time
 
 router = APIRouter(prefix="/api/attacks", tags=["attacks"])
 
@@ -22,8 +21,8 @@ router = APIRouter(prefix="/api/attacks", tags=["attacks"])
 launched_attacks = []
 
 
-@router.post("/launch")
-async def launch_attack(request: AttackLaunchRequest):
+@router.post("/launch", response_class=ORJSONResponse)
+async def launch_attack(request: AttackLaunchRequest) -> ORJSONResponse:
     """Launch an attack and generate alerts."""
     global launched_attacks
     
@@ -32,7 +31,6 @@ async def launch_attack(request: AttackLaunchRequest):
     
     print(f"[ATTACK] Launch request: attack_id={request.attack_id}, from={request.from_node}, to={request.to_node}")
     print(f"[ATTACK] Game state: scenario={game_state.current_scenario_id}, status={game_state.status}")
-    print(f"[ATTACK] Available scenarios: {list(scenarios_cache.keys())}")
     
     if game_state.status != GameStatus.RUNNING:
         print(f"[ATTACK] Error: Game is not running. Current status: {game_state.status}")
@@ -65,20 +63,17 @@ async def launch_attack(request: AttackLaunchRequest):
     
     scenario = scenarios_cache.get(game_state.current_scenario_id)
     if not scenario:
+        print(f"[ATTACK] Available scenarios: {list(scenarios_cache)}")
         raise HTTPException(status_code=404, detail=f"Scenario not found: {game_state.current_scenario_id}")
     
-    print(f"[ATTACK] Scenario loaded: {scenario.id}, attacks: {[a.id for a in scenario.attacks]}")
+    print(f"[ATTACK] Scenario loaded: {scenario.id}")
     
-    # Find the attack
-    attack = None
-    available_attack_ids = [a.id for a in scenario.attacks]
-    for a in scenario.attacks:
-        if a.id == request.attack_id:
-            attack = a
-            break
+    # Find the attack (O(1) via the scenario's id index)
+    attack = scenario.get_attack(request.attack_id)
     
     if not attack:
-        print(f"[ATTACK] Attack {request.attack_id} not found in scenario {scenario.id}")
+        available_attack_ids = list(scenario.attacks_by_id)
+        print(f"[ATTACK] Attack {request.attack_id} not found in scenario {scenario.id}, attacks: {available_attack_ids}")
         raise HTTPException(
             status_code=404,
             detail=f"Attack not found: {request.attack_id}. Available attacks: {available_attack_ids}"
@@ -86,51 +81,31 @@ async def launch_attack(request: AttackLaunchRequest):
     
     print(f"[ATTACK] Attack found: {attack.id}, type: {attack.attack_type}")
     
-    # Generate a new source IP for the attack (different from scan IPs)
-    # Initialize blocked IPs list if needed
-    if not hasattr(game_state, 'blocked_ips') or game_state.blocked_ips is None:
-        game_state.blocked_ips = []
-    if not hasattr(game_state, 'red_scan_ips') or game_state.red_scan_ips is None:
-        game_state.red_scan_ips = []
+    # One clock read for the launch time, its events and the turn change
+    now = datetime.utcnow()
     
-    # Generate attack source IP (ensure it's different from scan IPs)
-    attack_source_ip = None
+    # Generate attack source IP (ensure it's different from scan IPs; red_scan_ips is a set)
+    # A collision is ~1 in 11.6M per scan IP, so this nearly always takes one draw;
+    # after max_attempts the last candidate is used anyway
     max_attempts = 10
     for _ in range(max_attempts):
-        candidate_ip = f"{random.randint(198, 203)}.{random.randint(51, 99)}.{random.randint(100, 255)}.{random.randint(1, 254)}"
-        if candidate_ip not in game_state.red_scan_ips:
-            attack_source_ip = candidate_ip
+        attack_source_ip = random_source_ip()
+        if attack_source_ip not in game_state.red_scan_ips:
             break
     
-    # Fallback if we couldn't generate a unique IP
-    if not attack_source_ip:
-        attack_source_ip = f"{random.randint(198, 203)}.{random.randint(51, 99)}.{random.randint(100, 255)}.{random.randint(1, 254)}"
-    
     # Check if attack source IP is blocked
     is_blocked = attack_source_ip in game_state.blocked_ips
     if is_blocked:
         print(f"[ATTACK] Attack source IP {attack_source_ip} is blocked. Attack will be blocked.")
         # Award points to Blue team for blocking the attack
-        from app.routes.score import current_score
         current_score.blue = max(0, current_score.blue + 8)  # Blocked pre-detonation
         
-        # Emit score update
+        # Score update, then attack_resolved immediately for blocked attacks
         score_event = create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
+            current_score.snapshot(),
+            server_ts=now,
         )
-        await broadcaster.emit_to_all(score_event)
-        
-        if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(score_event)
-        
-        # Emit attack_resolved event immediately for blocked attacks
         resolve_event = create_event(
             EventKind.ATTACK_RESOLVED,
             {
@@ -143,47 +118,29 @@ async def launch_attack(request: AttackLaunchRequest):
                 "source_ip": attack_source_ip,
                 "score_deltas": {"red": 0, "blue": 8},
             },
+            server_ts=now,
         )
-        await broadcaster.emit_to_all(resolve_event)
-        
-        if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(resolve_event)
+        blocked_events = [score_event, resolve_event]
         
-        # Still change turn to Blue and return
-        old_turn = game_state.current_turn
+        # Still end Red's turn and return
         if game_state.current_turn == "red":
-            if not hasattr(game_state, 'red_turn_count'):
-                game_state.red_turn_count = 0
-            game_state.red_turn_count += 1
-            game_state.current_turn = "blue"
-            game_state.turn_start_time = datetime.utcnow()
-            game_state.blue_action_this_turn = False
             game_state.red_attack_this_turn = True
-            
-            turn_event = create_event(
-                EventKind.TURN_CHANGED,
-                {
-                    "turn": "blue",
-                    "reason": "attack_blocked",
-                    "previous_turn": old_turn,
-                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                }
-            )
-            await broadcaster.emit_to_all(turn_event)
-            
-            if settings.FEATURE_WS_SNAPSHOT:
-                from app.store import add_event
-                add_event(turn_event)
+            blocked_events.extend(advance_red_turn(game_state, "attack_blocked", now))
+        
+        # In order, in one pass over the clients
+        await broadcaster.emit_many_to_all(blocked_events)
+        
+        if settings.FEATURE_WS_SNAPSHOT:
+            add_events(blocked_events)
         
         # Return success response indicating attack was blocked
-        return {
+        return ORJSONResponse({
             "status": "blocked",
             "attack_id": attack.id,
             "message": f"Attack launched but blocked: Source IP {attack_source_ip} is blocked. Blue team receives +8 points for blocking the attack.",
             "source_ip": attack_source_ip,
             "is_blocked": True,
-        }
+        })
     
     # Check if attack requires scan
     # Note: We allow attacks even with wrong scans - players will be penalized for wrong choices
@@ -197,10 +154,8 @@ async def launch_attack(request: AttackLaunchRequest):
         # Note: We no longer require the scan tool to match - players can launch attacks with wrong scans
         # They'll be penalized for wrong scan/attack choices via the scoring system
     
-    attack_time = datetime.utcnow()
-    
     # Generate alerts first (needed for tiered resolution)
-    base_time = attack_time
+    base_time = now
     alerts = generate_alerts(
         attack,
         scenario,
@@ -211,14 +166,15 @@ async def launch_attack(request: AttackLaunchRequest):
     # Update alerts to include attack source IP
     for alert in alerts:
         if alert.ioc:
-            alert.ioc["source_ip"] = attack_source_ip
-            alert.ioc["blocked"] = is_blocked
+            alert.ioc.source_ip = attack_source_ip
+            alert.ioc.blocked = is_blocked
     
     # Track this attack (store alerts for tiered resolution)
     launched_attacks.append({
         "attack_id": attack.id,
         "attack": attack,
-        "timestamp": attack_time,
+        "timestamp": now,
+        "launch_monotonic": time.perf_counter(),  # For response-time math (immune to wall-clock jumps)
         "alerts": alerts,  # Store alerts for tiered resolution
         "player_name": request.player_name,
         "source_ip": attack_source_ip,
@@ -237,149 +193,61 @@ async def launch_attack(request: AttackLaunchRequest):
             "source_ip": attack_source_ip,
             "is_blocked": is_blocked,
         },
+        server_ts=now,
     )
     print(f"[ATTACK] Emitting attack_launched event: attack_id={attack.id}, type={attack.attack_type.value}, from={request.from_node}, to={request.to_node}")
-    # emit_to_all now handles all broadcasting (broadcast + role rooms + session-scoped rooms)
-    await broadcaster.emit_to_all(launch_event)
-    
-    # Store event if snapshot feature is enabled
-    if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
-        add_event(launch_event)
+    # Sent together with the turn change below, in one pass over the clients
+    launch_events = [launch_event]
     
     # Mark that Red has attacked this turn
     game_state.red_attack_this_turn = True
     
     # Change turn to Blue IMMEDIATELY after attack launch (before emitting events)
     # This ensures Blue team can respond right away
-    old_turn = game_state.current_turn
     if game_state.current_turn == "red":
-        # Initialize turn counters if they don't exist (defensive check for backwards compatibility)
-        if not hasattr(game_state, 'red_turn_count'):
-            game_state.red_turn_count = 0
-        if not hasattr(game_state, 'blue_turn_count'):
-            game_state.blue_turn_count = 0
-        
-        # Increment Red's turn counter
-        game_state.red_turn_count += 1
-        print(f"[ATTACK] Red team turn count: {game_state.red_turn_count}")
-        
-        # Check if both teams have completed their turns
-        max_turns = getattr(game_state, 'max_turns_per_side', None)
-        if max_turns:
-            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-            red_done = red_turn_count >= max_turns
-            blue_done = blue_turn_count >= max_turns
-            
-            if red_done and blue_done:
-                print(f"[ATTACK] Both teams have completed their turns ({max_turns} each). Ending round.")
-                game_state.status = GameStatus.FINISHED
-                
-                # Emit round_ended event
-                end_event = create_event(
-                    EventKind.ROUND_ENDED,
-                    {
-                        "reason": "turn_limit_reached",
-                        "elapsed_seconds": game_state.timer or 0,
-                        "red_turns": red_turn_count,
-                        "blue_turns": blue_turn_count,
-                        "max_turns_per_side": max_turns,
-                    }
-                )
-                await broadcaster.emit_to_all(end_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(end_event)
-                
-                # Don't advance turn, game is over
-                # But still emit the attack event and return normally
-            else:
-                # Continue with turn change
-                game_state.current_turn = "blue"
-                game_state.turn_start_time = datetime.utcnow()  # Start Blue's turn timer
-                # Reset Blue's action limit for the new turn
-                game_state.blue_action_this_turn = False
-                print(f"[ATTACK] Turn changed from {old_turn} to Blue after attack launch at {game_state.turn_start_time.isoformat()}")
-                
-                # Emit turn_changed event FIRST so Blue team knows it's their turn
-                turn_event = create_event(
-                    EventKind.TURN_CHANGED,
-                    {
-                        "turn": "blue",
-                        "reason": "attack_launched",
-                        "previous_turn": old_turn,
-                        "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                    }
-                )
-                print(f"[ATTACK] Emitting TURN_CHANGED event: turn=blue, reason=attack_launched")
-                await broadcaster.emit_to_all(turn_event)
-                
-                # Store event if snapshot feature is enabled
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(turn_event)
-        else:
-            # No turn limit, proceed normally
-            game_state.current_turn = "blue"
-            game_state.turn_start_time = datetime.utcnow()  # Start Blue's turn timer
-            # Reset Blue's action limit for the new turn
-            game_state.blue_action_this_turn = False
-            print(f"[ATTACK] Turn changed from {old_turn} to Blue after attack launch at {game_state.turn_start_time.isoformat()}")
-            
-            # Emit turn_changed event FIRST so Blue team knows it's their turn
-            turn_event = create_event(
-                EventKind.TURN_CHANGED,
-                {
-                    "turn": "blue",
-                    "reason": "attack_launched",
-                    "previous_turn": old_turn,
-                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                }
-            )
-            print(f"[ATTACK] Emitting TURN_CHANGED event: turn=blue, reason=attack_launched")
-            await broadcaster.emit_to_all(turn_event)
-            
-            # Store event if snapshot feature is enabled
-            if settings.FEATURE_WS_SNAPSHOT:
-                from app.store import add_event
-                add_event(turn_event)
+        # Counts Red's turn; ends the round instead if both teams have used all their turns
+        launch_events.extend(advance_red_turn(game_state, "attack_launched", now))
     else:
         print(f"[ATTACK] WARNING: Turn is already {game_state.current_turn}, not changing to Blue")
     
+    # attack_launched, then turn_changed / round_ended, in order
+    await broadcaster.emit_many_to_all(launch_events)
+    
+    # Store events if snapshot feature is enabled
+    if settings.FEATURE_WS_SNAPSHOT:
+        add_events(launch_events)
+    
     # Emit alerts (to blue and audience, not red)
     # Convert alerts to JSON-serializable format
     alerts_json = []
+    alert_events = []
     for alert in alerts:
-        # Ensure timestamp is serialized as ISO string
-        alert_dict = alert.model_dump()
-        if isinstance(alert_dict.get("timestamp"), datetime):
-            alert_dict["timestamp"] = alert_dict["timestamp"].isoformat()
+        # mode="json" serializes the timestamp as an ISO string
+        alert_dict = alert.model_dump(mode="json")
         
         alerts_json.append(alert_dict)
-        
-        alert_event = create_event(
+        alert_events.append(create_event(
             EventKind.ALERT_EMITTED,
             alert_dict,
-        )
-        await broadcaster.emit_to_roles(["blue", "audience", "gm"], alert_event)
-        
-        # Store event if snapshot feature is enabled
-        if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(alert_event)
+            server_ts=now,
+        ))
         
         print(f"[ATTACK] Emitted alert: {alert.id}, source: {alert.source}, severity: {alert.severity}")
     
+    # All alerts, in order, in one pass over the rooms' clients
+    await broadcaster.emit_many_to_roles(["blue", "audience", "gm"], alert_events)
+    
+    # Store events if snapshot feature is enabled
+    if settings.FEATURE_WS_SNAPSHOT:
+        add_events(alert_events)
+    
     print(f"[ATTACK] Generated {len(alerts)} alerts for attack {attack.id}")
     
     # Check if attack is correct for the scenario immediately
     # This determines if the attack can succeed (correct choice) or will miss (incorrect choice)
-    is_correct_attack = getattr(attack, 'is_correct_choice', False)
+    is_correct_attack = attack.is_correct_choice
     
     # Award/penalize points for attack choice
-    from app.routes.score import current_score
     attack_choice_points = 0
     if is_correct_attack:
         # Correct attack chosen - award points
@@ -393,22 +261,14 @@ async def launch_attack(request: AttackLaunchRequest):
     # Update score immediately for attack choice
     current_score.red = max(0, current_score.red + attack_choice_points)
     
-    # Emit score update if points changed
+    # Score update if points changed (a miss sends it together with its attack_resolved)
+    score_events = []
     if attack_choice_points != 0:
-        score_event = create_event(
+        score_events.append(create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
-        )
-        await broadcaster.emit_to_all(score_event)
-        
-        if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(score_event)
+            current_score.snapshot(),
+            server_ts=now,
+        ))
     
     # If attack is incorrect, it's a miss - no need to wait for Blue
     if not is_correct_attack:
@@ -427,27 +287,23 @@ async def launch_attack(request: AttackLaunchRequest):
                 "reason": "Attack does not match scenario artifacts",
                 "score_deltas": {"red": attack_choice_points, "blue": 0},  # Include attack choice points
             },
+            server_ts=now,
         )
-        await broadcaster.emit_to_all(resolve_event)
-        
-        # Store event if snapshot feature is enabled
-        if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
-            add_event(resolve_event)
-        
-        return {
-            "attack_id": attack.id,
-            "result": "miss",  # Incorrect attack = miss
-            "alerts_count": len(alerts),
-            "alerts": alerts_json,
-        }
+        score_events.append(resolve_event)
     
-    # Correct attack - proceed normally, will be resolved when Blue responds
-    print(f"[ATTACK] Attack {attack.id} is the correct choice - waiting for Blue response")
+    await broadcaster.emit_many_to_all(score_events)
     
-    return {
+    # Store events if snapshot feature is enabled
+    if settings.FEATURE_WS_SNAPSHOT:
+        add_events(score_events)
+    
+    if is_correct_attack:
+        # Correct attack - proceed normally, will be resolved when Blue responds
+        print(f"[ATTACK] Attack {attack.id} is the correct choice - waiting for Blue response")
+    
+    return ORJSONResponse({
         "attack_id": attack.id,
-        "result": "pending",  # Will be resolved when Blue responds
+        "result": "pending" if is_correct_attack else "miss",  # Pending until Blue responds; incorrect attack = miss
         "alerts_count": len(alerts),
         "alerts": alerts_json,  # Include alerts in response for fallback
-    }
+    })
@@ -9,6 +9,7 @@ from app.services.auth import (
     create_access_token,
     decode_access_token,
 )
+from app.services.rate_limit import SlidingWindowRateLimiter
 from datetime import timedelta
 import time
 
@@ -16,30 +17,14 @@ router = APIRouter(prefix="/api/auth", tags=["auth"])
 security = HTTPBearer()
 
 # Simple rate limiting (in-memory, per IP)
-_rate_limit_store: dict[str, list[float]] = {}
 RATE_LIMIT_WINDOW = 60  # 1 minute
 RATE_LIMIT_MAX_REQUESTS = 10  # Increased from 5 to 10 for better development experience
+_rate_limiter = SlidingWindowRateLimiter(RATE_LIMIT_WINDOW, RATE_LIMIT_MAX_REQUESTS)
 
 
 def check_rate_limit(ip: str) -> bool:
-    """Check if IP is within rate limit."""
-    now = time.time()
-    if ip not in _rate_limit_store:
-        _rate_limit_store[ip] = []
-    
-    # Remove old requests outside window
-    _rate_limit_store[ip] = [
-        req_time for req_time in _rate_limit_store[ip]
-        if now - req_time < RATE_LIMIT_WINDOW
-    ]
-    
-    # Check if limit exceeded
-    if len(_rate_limit_store[ip]) >= RATE_LIMIT_MAX_REQUESTS:
-        return False
-    
-    # Add current request
-    _rate_limit_store[ip].append(now)
-    return True
+    """Check if IP is within rate limit (and count this request if so)."""
+    return _rate_limiter.allow(ip)
 
 
 def get_client_ip(request: Request) -> str:
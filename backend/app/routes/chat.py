@@ -1,5 +1,6 @@
 """Chat routes for team communication."""
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from app.models import ChatRequest, ChatMessage, GameStatus
 from app.routes.game import game_state
 from app.ws import broadcaster, create_event
@@ -60,27 +61,18 @@ async def send_message(request: ChatRequest) -> dict:
     return {"success": True, "message_id": message.id}
 
 
-@router.get("/history")
-async def get_chat_history(role: str) -> dict:
+@router.get("/history", response_class=ORJSONResponse)
+async def get_chat_history(role: str) -> ORJSONResponse:
     """Get chat history for a role."""
     if role not in ["red", "blue", "gm", "audience"]:
         raise HTTPException(status_code=400, detail="Invalid role")
     
     messages = _chat_history.get(role, [])
-    # Convert to JSON-serializable format
-    return {
+    # orjson encodes the timestamps natively; session_id stays server-side
+    return ORJSONResponse({
         "role": role,
-        "messages": [
-            {
-                "id": msg.id,
-                "player_name": msg.player_name,
-                "role": msg.role,
-                "message": msg.message,
-                "timestamp": msg.timestamp.isoformat(),
-            }
-            for msg in messages
-        ],
-    }
+        "messages": [msg.model_dump(exclude={"session_id"}) for msg in messages],
+    })
 
 
 def clear_chat_history():
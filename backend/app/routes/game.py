@@ -11,6 +11,7 @@ from app.services.seed import load_scenarios_from_yaml, create_default_scenarios
 from app.routes.scenarios import scenarios_cache
 from app.ws import broadcaster, create_event
 from app.settings import settings
+from app.store import add_event, clear_events
 from app.services.timer import start_timer, stop_timer
 from datetime import datetime
 import uuid
@@ -90,7 +91,6 @@ async def start_game(request: GameStartRequest) -> GameState:
         
         # Store event if snapshot feature is enabled
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(event)
         
         # Wait a brief moment to ensure the round_ended event propagates
@@ -109,13 +109,14 @@ async def start_game(request: GameStartRequest) -> GameState:
     
     # Clear previous round data
     from app.routes.attacks import launched_attacks
-    from app.routes.actions import blue_actions
+    from app.routes.actions import clear_blue_actions, clear_vote_tallies
     from app.routes.voting import clear_voting_data
     from app.routes.chat import clear_chat_history
     from app.routes.activity import clear_activity_history
     from app.routes.presence import clear_presence
     launched_attacks.clear()
-    blue_actions.clear()
+    clear_blue_actions()
+    clear_vote_tallies()
     clear_voting_data()
     clear_chat_history()
     clear_activity_history()
@@ -162,8 +163,8 @@ async def start_game(request: GameStartRequest) -> GameState:
     game_state.red_pivot_votes = {}  # Clear Red team pivot votes
     game_state.red_attack_selected = False
     game_state.red_attack_votes = {}  # Clear Red team attack votes
-    game_state.red_scan_ips = []  # Clear scan IPs
-    game_state.blocked_ips = []  # Clear blocked IPs
+    game_state.red_scan_ips = set()  # Clear scan IPs
+    game_state.blocked_ips = set()  # Clear blocked IPs
     # Reset briefing dismissed flag
     game_state.red_briefing_dismissed = False
     # Reset per-turn action limits
@@ -200,7 +201,6 @@ async def start_game(request: GameStartRequest) -> GameState:
     
     # Store event if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(event)
     
     # Emit score reset event
@@ -217,7 +217,6 @@ async def start_game(request: GameStartRequest) -> GameState:
     
     # Store event if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(score_event)
     
     print(f"[GAME] Returning game state: status={game_state.status}")
@@ -259,7 +258,6 @@ async def dismiss_briefing() -> GameState:
     await broadcaster.emit_to_all(event)
     
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(event)
     
     return game_state
@@ -349,7 +347,6 @@ async def stop_game() -> GameState:
     
     # Store event if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(event)
     
     print(f"[GAME] Game stopped: status={game_state.status}")
@@ -393,7 +390,6 @@ async def reset_game() -> GameState:
         
         # Store event if snapshot feature is enabled
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(event)
         
         print(f"[GAME] Stopping game session before reset (status: {old_status})")
@@ -428,8 +424,8 @@ async def reset_game() -> GameState:
     game_state.red_pivot_votes = {}  # Clear Red team pivot votes
     game_state.red_attack_selected = False
     game_state.red_attack_votes = {}  # Clear Red team attack votes
-    game_state.red_scan_ips = []  # Clear scan IPs
-    game_state.blocked_ips = []  # Clear blocked IPs
+    game_state.red_scan_ips = set()  # Clear scan IPs
+    game_state.blocked_ips = set()  # Clear blocked IPs
     # Reset briefing dismissed flag
     game_state.red_briefing_dismissed = False
     # Reset per-turn action limits
@@ -447,11 +443,12 @@ async def reset_game() -> GameState:
     
     # Reset launched attacks and blue actions
     from app.routes.attacks import launched_attacks
-    from app.routes.actions import blue_actions
+    from app.routes.actions import clear_blue_actions, clear_vote_tallies
     from app.routes.voting import clear_voting_data
     from app.services.name_assignment import clear_session_names
     launched_attacks.clear()
-    blue_actions.clear()
+    clear_blue_actions()
+    clear_vote_tallies()
     clear_voting_data()
     
     # Clear names for all sessions (or specific session if we have session_id)
@@ -463,7 +460,6 @@ async def reset_game() -> GameState:
     
     # Clear event store if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import clear_events
         clear_events()
     
     print(f"[GAME] Resetting game to lobby state")
@@ -476,7 +472,6 @@ async def reset_game() -> GameState:
         
         # Store event if snapshot feature is enabled
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(event)
     
     # Emit score reset event
@@ -493,7 +488,6 @@ async def reset_game() -> GameState:
     
     # Store event if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(score_event)
     
     print(f"[GAME] Game reset complete: status={game_state.status}, round={game_state.round}, scenario={game_state.current_scenario_id}")
@@ -512,7 +506,6 @@ async def inject_event(event_type: str, target: str, note: str):
     
     # Store event if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(event)
     
     return {"status": "injected"}
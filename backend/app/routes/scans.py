@@ -3,11 +3,17 @@ from fastapi import APIRouter, HTTPException
 from app.models import ScanRequest, ScanResult, ScanToolType, EventKind, GameStatus
 from app.routes import game
 from app.routes.scenarios import scenarios_cache
+from app.services.source_ip import random_source_ip
+from app.services.turn import advance_blue_turn, advance_red_turn
+from app.services.votes import game_vote_tally
 from app.ws import broadcaster, create_event
 from app.settings import settings
+from app.store import add_event, add_events
 from datetime import datetime
 import uuid
-import random
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/scans", tags=["scans"])
 
@@ -30,38 +36,20 @@ async def identify_ip(request: dict) -> dict:
     if game_state.current_turn != "blue":
         raise HTTPException(status_code=400, detail="It's not Blue team's turn")
     
-    # Initialize votes dict if needed
-    if not hasattr(game_state, 'blue_ip_votes') or game_state.blue_ip_votes is None:
-        game_state.blue_ip_votes = {}
-    
-    # Initialize scan IPs list if needed
-    if not hasattr(game_state, 'red_scan_ips') or game_state.red_scan_ips is None:
-        game_state.red_scan_ips = []
-    
-    # Store the vote
-    game_state.blue_ip_votes[player_name] = ip_address
+    # Store the vote (counts are maintained incrementally)
+    tally = game_vote_tally(game_state, "blue_ip_votes")
+    tally.cast(player_name, ip_address)
     
     # Check if this is the correct answer (any scan IP is correct, but we'll use the first one as the "primary" scan IP)
     # In Turn 2, Blue team should identify which IP was used for scanning
-    correct_ips = game_state.red_scan_ips if game_state.red_scan_ips else []
+    correct_ips = game_state.red_scan_ips
     is_correct = ip_address in correct_ips
     
-    # Calculate vote counts
-    vote_counts = {}
-    for ip in game_state.blue_ip_votes.values():
-        vote_counts[ip] = vote_counts.get(ip, 0) + 1
-    
-    # Determine majority vote
-    total_votes = len(game_state.blue_ip_votes)
-    majority_ip = None
-    majority_count = 0
-    for ip, count in vote_counts.items():
-        if count > majority_count:
-            majority_count = count
-            majority_ip = ip
-    
-    # Check if majority has been reached (more than 50% of votes)
-    has_majority = majority_count > (total_votes / 2) if total_votes > 0 else False
+    vote_counts = dict(tally.counts)
+    total_votes = len(tally.votes)
+    
+    # Majority = more than 50% of votes
+    majority_ip, has_majority = tally.majority()
     majority_is_correct = (majority_ip in correct_ips) if correct_ips and majority_ip else False
     
     # Award points for correct identification (only once, when majority is reached)
@@ -74,17 +62,11 @@ async def identify_ip(request: dict) -> dict:
         # Emit score update
         score_event = create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
+            current_score.snapshot(),
         )
         await broadcaster.emit_to_all(score_event)
         
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(score_event)
     
     # Emit IP identification event
@@ -106,100 +88,16 @@ async def identify_ip(request: dict) -> dict:
     await broadcaster.emit_to_all(ident_event)
     
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(ident_event)
     
     # Switch turn to Red team after Blue team completes Turn 2 (IP identification)
     # Only switch if we have a majority vote (correct or incorrect) and it's still Blue's turn
     if has_majority and game_state.current_turn == "blue":
-        from datetime import datetime
-        
-        # Initialize turn counters if needed
-        if not hasattr(game_state, 'red_turn_count'):
-            game_state.red_turn_count = 0
-        if not hasattr(game_state, 'blue_turn_count'):
-            game_state.blue_turn_count = 0
+        turn_events = advance_blue_turn(game_state, "ip_identified")
+        await broadcaster.emit_many_to_all(turn_events)
         
-        # Increment Blue's turn count (Turn 2 complete)
-        game_state.blue_turn_count += 1
-        print(f"[SCAN] Blue team turn count: {game_state.blue_turn_count}")
-        
-        # Check if both teams have completed their turns
-        max_turns = getattr(game_state, 'max_turns_per_side', None)
-        if max_turns:
-            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-            red_done = red_turn_count >= max_turns
-            blue_done = blue_turn_count >= max_turns
-            
-            if red_done and blue_done:
-                print(f"[SCAN] Both teams have completed their turns ({max_turns} each). Ending round.")
-                game_state.status = GameStatus.FINISHED
-                
-                # Emit round_ended event
-                end_event = create_event(
-                    EventKind.ROUND_ENDED,
-                    {
-                        "reason": "turn_limit_reached",
-                        "elapsed_seconds": game_state.timer or 0,
-                        "red_turns": red_turn_count,
-                        "blue_turns": blue_turn_count,
-                        "max_turns_per_side": max_turns,
-                    }
-                )
-                await broadcaster.emit_to_all(end_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(end_event)
-            else:
-                # Switch to Red team
-                old_turn = game_state.current_turn
-                game_state.current_turn = "red"
-                game_state.turn_start_time = datetime.utcnow()
-                game_state.red_attack_this_turn = False
-                print(f"[SCAN] Turn changed from {old_turn} to Red after IP identification at {game_state.turn_start_time.isoformat()}")
-                
-                # Emit turn_changed event
-                turn_event = create_event(
-                    EventKind.TURN_CHANGED,
-                    {
-                        "turn": "red",
-                        "reason": "ip_identified",
-                        "previous_turn": old_turn,
-                        "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                    }
-                )
-                print(f"[SCAN] Emitting TURN_CHANGED event: turn=red, reason=ip_identified")
-                await broadcaster.emit_to_all(turn_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(turn_event)
-        else:
-            # No turn limit, proceed normally
-            old_turn = game_state.current_turn
-            game_state.current_turn = "red"
-            game_state.turn_start_time = datetime.utcnow()
-            game_state.red_attack_this_turn = False
-            print(f"[SCAN] Turn changed from {old_turn} to Red after IP identification at {game_state.turn_start_time.isoformat()}")
-            
-            # Emit turn_changed event
-            turn_event = create_event(
-                EventKind.TURN_CHANGED,
-                {
-                    "turn": "red",
-                    "reason": "ip_identified",
-                    "previous_turn": old_turn,
-                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                }
-            )
-            print(f"[SCAN] Emitting TURN_CHANGED event: turn=red, reason=ip_identified")
-            await broadcaster.emit_to_all(turn_event)
-            
-            if settings.FEATURE_WS_SNAPSHOT:
-                from app.store import add_event
-                add_event(turn_event)
+        if settings.FEATURE_WS_SNAPSHOT:
+            add_events(turn_events)
     
     return {
         "success": True,
@@ -245,29 +143,15 @@ async def select_pivot_strategy(request: dict) -> dict:
     correct_strategy = "alternative"  # Can be enhanced based on actual attack outcome
     is_correct = (pivot_strategy == correct_strategy)
     
-    # Initialize votes dict if needed
-    if not hasattr(game_state, 'red_pivot_votes') or game_state.red_pivot_votes is None:
-        game_state.red_pivot_votes = {}
-    
-    # Store the vote
-    game_state.red_pivot_votes[player_name] = pivot_strategy
-    
-    # Calculate vote counts
-    vote_counts = {}
-    for strategy in game_state.red_pivot_votes.values():
-        vote_counts[strategy] = vote_counts.get(strategy, 0) + 1
-    
-    # Determine majority vote
-    total_votes = len(game_state.red_pivot_votes)
-    majority_strategy = None
-    majority_count = 0
-    for strategy, count in vote_counts.items():
-        if count > majority_count:
-            majority_count = count
-            majority_strategy = strategy
-    
-    # Check if majority has been reached (more than 50% of votes)
-    has_majority = majority_count > (total_votes / 2) if total_votes > 0 else False
+    # Store the vote (counts are maintained incrementally)
+    tally = game_vote_tally(game_state, "red_pivot_votes")
+    tally.cast(player_name, pivot_strategy)
+    
+    vote_counts = dict(tally.counts)
+    total_votes = len(tally.votes)
+    
+    # Majority = more than 50% of votes
+    majority_strategy, has_majority = tally.majority()
     majority_is_correct = (majority_strategy == correct_strategy) if correct_strategy and majority_strategy else False
     
     # Award points for correct strategy selection (only once, when majority is reached)
@@ -280,17 +164,11 @@ async def select_pivot_strategy(request: dict) -> dict:
         # Emit score update
         score_event = create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
+            current_score.snapshot(),
         )
         await broadcaster.emit_to_all(score_event)
         
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(score_event)
     
     # Emit pivot strategy selected event
@@ -312,99 +190,15 @@ async def select_pivot_strategy(request: dict) -> dict:
     await broadcaster.emit_to_all(ident_event)
     
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(ident_event)
     
     # Switch turn to Blue team after Red team completes Turn 4 (pivot strategy selection)
     if has_majority and game_state.current_turn == "red":
-        from datetime import datetime
-        
-        # Initialize turn counters if needed
-        if not hasattr(game_state, 'red_turn_count'):
-            game_state.red_turn_count = 0
-        if not hasattr(game_state, 'blue_turn_count'):
-            game_state.blue_turn_count = 0
+        turn_events = advance_red_turn(game_state, "pivot_strategy_selected")
+        await broadcaster.emit_many_to_all(turn_events)
         
-        # Increment Red's turn count (Turn 4 complete)
-        game_state.red_turn_count += 1
-        print(f"[SCAN] Red team turn count: {game_state.red_turn_count}")
-        
-        # Check if both teams have completed their turns
-        max_turns = getattr(game_state, 'max_turns_per_side', None)
-        if max_turns:
-            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-            red_done = red_turn_count >= max_turns
-            blue_done = blue_turn_count >= max_turns
-            
-            if red_done and blue_done:
-                print(f"[SCAN] Both teams have completed their turns ({max_turns} each). Ending round.")
-                game_state.status = GameStatus.FINISHED
-                
-                # Emit round_ended event
-                end_event = create_event(
-                    EventKind.ROUND_ENDED,
-                    {
-                        "reason": "turn_limit_reached",
-                        "elapsed_seconds": game_state.timer or 0,
-                        "red_turns": red_turn_count,
-                        "blue_turns": blue_turn_count,
-                        "max_turns_per_side": max_turns,
-                    }
-                )
-                await broadcaster.emit_to_all(end_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(end_event)
-            else:
-                # Switch to Blue team
-                old_turn = game_state.current_turn
-                game_state.current_turn = "blue"
-                game_state.turn_start_time = datetime.utcnow()
-                game_state.blue_action_this_turn = False
-                print(f"[SCAN] Turn changed from {old_turn} to Blue after pivot strategy selection at {game_state.turn_start_time.isoformat()}")
-                
-                # Emit turn_changed event
-                turn_event = create_event(
-                    EventKind.TURN_CHANGED,
-                    {
-                        "turn": "blue",
-                        "reason": "pivot_strategy_selected",
-                        "previous_turn": old_turn,
-                        "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                    }
-                )
-                print(f"[SCAN] Emitting TURN_CHANGED event: turn=blue, reason=pivot_strategy_selected")
-                await broadcaster.emit_to_all(turn_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(turn_event)
-        else:
-            # No turn limit, proceed normally
-            old_turn = game_state.current_turn
-            game_state.current_turn = "blue"
-            game_state.turn_start_time = datetime.utcnow()
-            game_state.blue_action_this_turn = False
-            print(f"[SCAN] Turn changed from {old_turn} to Blue after pivot strategy selection at {game_state.turn_start_time.isoformat()}")
-            
-            # Emit turn_changed event
-            turn_event = create_event(
-                EventKind.TURN_CHANGED,
-                {
-                    "turn": "blue",
-                    "reason": "pivot_strategy_selected",
-                    "previous_turn": old_turn,
-                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                }
-            )
-            print(f"[SCAN] Emitting TURN_CHANGED event: turn=blue, reason=pivot_strategy_selected")
-            await broadcaster.emit_to_all(turn_event)
-            
-            if settings.FEATURE_WS_SNAPSHOT:
-                from app.store import add_event
-                add_event(turn_event)
+        if settings.FEATURE_WS_SNAPSHOT:
+            add_events(turn_events)
     
     return {
         "success": True,
@@ -441,7 +235,7 @@ async def select_attack(request: dict) -> dict:
     # Check if it's Turn 3 (red_turn_count should be 1, meaning they've completed Turn 1 and are on Turn 2, which is actually Turn 3)
     # Actually, let's check: Turn 1 = red_turn_count 0, Turn 2 = red_turn_count 1, Turn 3 = red_turn_count 2
     # So for Turn 3, we want red_turn_count == 1 (they've completed 1 turn, so they're on their 2nd turn, which is Turn 3)
-    red_turn_count = getattr(game_state, 'red_turn_count', 0)
+    red_turn_count = game_state.red_turn_count
     if red_turn_count != 1:
         raise HTTPException(status_code=400, detail=f"Attack selection voting is only available in Turn 3. Current turn count: {red_turn_count + 1}")
     
@@ -454,19 +248,15 @@ async def select_attack(request: dict) -> dict:
         raise HTTPException(status_code=404, detail=f"Scenario not found: {game_state.current_scenario_id}")
     
     # Find the attack in the scenario
-    attack = None
-    for a in scenario.attacks:
-        if a.id == attack_id:
-            attack = a
-            break
+    attack = scenario.get_attack(attack_id)
     
     if not attack:
         raise HTTPException(status_code=404, detail=f"Attack not found: {attack_id}")
     
     # Check if attack requires scan and if scan was completed
     if attack.requires_scan:
-        scan_results = getattr(game_state, 'red_scan_results', [])
-        print(f"[SELECT-ATTACK] Attack requires scan. Scan results count: {len(scan_results)}")
+        scan_results = game_state.red_scan_results
+        logger.debug("[SELECT-ATTACK] Attack requires scan. Scan results count: %s", len(scan_results))
         if not scan_results:
             raise HTTPException(status_code=400, detail="This attack requires a scan, but no scans have been completed")
         
@@ -475,17 +265,17 @@ async def select_attack(request: dict) -> dict:
             # Get the string value from the enum (e.g., "OWASP ZAP")
             # ScanToolType is a string enum, so .value gives us the string
             normalized_required_tool = attack.required_scan_tool.value
-            print(f"[SELECT-ATTACK] Required tool: {normalized_required_tool} (type: {type(normalized_required_tool)})")
+            logger.debug("[SELECT-ATTACK] Required tool: %s (type: %s)", normalized_required_tool, type(normalized_required_tool))
             
             # Check each scan result
             found_tools = []
             for scan in scan_results:
                 scan_tool = scan.get('tool')
                 found_tools.append(str(scan_tool))
-                print(f"[SELECT-ATTACK] Checking scan tool: {scan_tool} (type: {type(scan_tool)})")
+                logger.debug("[SELECT-ATTACK] Checking scan tool: %s (type: %s)", scan_tool, type(scan_tool))
             
             has_matching_scan = any(str(scan.get('tool')) == normalized_required_tool for scan in scan_results)
-            print(f"[SELECT-ATTACK] Has matching scan: {has_matching_scan}")
+            logger.debug("[SELECT-ATTACK] Has matching scan: %s", has_matching_scan)
             
             if not has_matching_scan:
                 raise HTTPException(status_code=400, detail=f"This attack requires a {normalized_required_tool} scan, but no matching scan was found. Available scans: {', '.join(found_tools)}")
@@ -499,29 +289,15 @@ async def select_attack(request: dict) -> dict:
     
     is_correct = (attack_id == correct_attack_id) if correct_attack_id else False
     
-    # Initialize votes dict if needed
-    if not hasattr(game_state, 'red_attack_votes') or game_state.red_attack_votes is None:
-        game_state.red_attack_votes = {}
-    
-    # Store the vote
-    game_state.red_attack_votes[player_name] = attack_id
-    
-    # Calculate vote counts
-    vote_counts = {}
-    for voted_attack_id in game_state.red_attack_votes.values():
-        vote_counts[voted_attack_id] = vote_counts.get(voted_attack_id, 0) + 1
-    
-    # Determine majority vote
-    total_votes = len(game_state.red_attack_votes)
-    majority_attack_id = None
-    majority_count = 0
-    for voted_attack_id, count in vote_counts.items():
-        if count > majority_count:
-            majority_count = count
-            majority_attack_id = voted_attack_id
-    
-    # Check if majority has been reached (more than 50% of votes)
-    has_majority = majority_count > (total_votes / 2) if total_votes > 0 else False
+    # Store the vote (counts are maintained incrementally)
+    tally = game_vote_tally(game_state, "red_attack_votes")
+    tally.cast(player_name, attack_id)
+    
+    vote_counts = dict(tally.counts)
+    total_votes = len(tally.votes)
+    
+    # Majority = more than 50% of votes
+    majority_attack_id, has_majority = tally.majority()
     majority_is_correct = (majority_attack_id == correct_attack_id) if correct_attack_id and majority_attack_id else False
     
     # Set red_attack_selected to True when majority is reached (allows launching the selected attack)
@@ -540,17 +316,11 @@ async def select_attack(request: dict) -> dict:
         # Emit score update
         score_event = create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
+            current_score.snapshot(),
         )
         await broadcaster.emit_to_all(score_event)
         
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(score_event)
     
     # Emit attack selected event
@@ -572,7 +342,6 @@ async def select_attack(request: dict) -> dict:
     await broadcaster.emit_to_all(ident_event)
     
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(ident_event)
     
     return {
@@ -616,33 +385,19 @@ async def identify_vulnerability(request: dict) -> dict:
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
     
-    # Initialize votes dict if needed
-    if not hasattr(game_state, 'red_vulnerability_votes') or game_state.red_vulnerability_votes is None:
-        game_state.red_vulnerability_votes = {}
-    
-    # Store the vote
-    game_state.red_vulnerability_votes[player_name] = scan_tool
+    # Store the vote (counts are maintained incrementally)
+    tally = game_vote_tally(game_state, "red_vulnerability_votes")
+    tally.cast(player_name, scan_tool)
     
     # Check if this is the correct answer
     correct_tool = scenario.required_scan_tool.value if scenario.required_scan_tool else None
     is_correct = (scan_tool == correct_tool) if correct_tool else False
     
-    # Calculate vote counts
-    vote_counts = {}
-    for tool in game_state.red_vulnerability_votes.values():
-        vote_counts[tool] = vote_counts.get(tool, 0) + 1
-    
-    # Determine majority vote
-    total_votes = len(game_state.red_vulnerability_votes)
-    majority_tool = None
-    majority_count = 0
-    for tool, count in vote_counts.items():
-        if count > majority_count:
-            majority_count = count
-            majority_tool = tool
-    
-    # Check if majority has been reached (more than 50% of votes)
-    has_majority = majority_count > (total_votes / 2) if total_votes > 0 else False
+    vote_counts = dict(tally.counts)
+    total_votes = len(tally.votes)
+    
+    # Majority = more than 50% of votes
+    majority_tool, has_majority = tally.majority()
     majority_is_correct = (majority_tool == correct_tool) if correct_tool and majority_tool else False
     
     # Award points for correct identification (only once, when majority is reached)
@@ -655,17 +410,11 @@ async def identify_vulnerability(request: dict) -> dict:
         # Emit score update
         score_event = create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
+            current_score.snapshot(),
         )
         await broadcaster.emit_to_all(score_event)
         
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(score_event)
     
     # Emit vulnerability identification event
@@ -687,100 +436,16 @@ async def identify_vulnerability(request: dict) -> dict:
     await broadcaster.emit_to_all(ident_event)
     
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(ident_event)
     
     # Switch turn to Blue team after Red team completes Turn 1 (vulnerability identification)
     # Only switch if we have a majority vote (correct or incorrect) and it's still Red's turn
     if has_majority and game_state.current_turn == "red":
-        from datetime import datetime
-        
-        # Initialize turn counters if needed
-        if not hasattr(game_state, 'red_turn_count'):
-            game_state.red_turn_count = 0
-        if not hasattr(game_state, 'blue_turn_count'):
-            game_state.blue_turn_count = 0
+        turn_events = advance_red_turn(game_state, "vulnerability_identified")
+        await broadcaster.emit_many_to_all(turn_events)
         
-        # Increment Red's turn count (Turn 1 complete)
-        game_state.red_turn_count += 1
-        print(f"[SCAN] Red team turn count: {game_state.red_turn_count}")
-        
-        # Check if both teams have completed their turns
-        max_turns = getattr(game_state, 'max_turns_per_side', None)
-        if max_turns:
-            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
-            red_done = red_turn_count >= max_turns
-            blue_done = blue_turn_count >= max_turns
-            
-            if red_done and blue_done:
-                print(f"[SCAN] Both teams have completed their turns ({max_turns} each). Ending round.")
-                game_state.status = GameStatus.FINISHED
-                
-                # Emit round_ended event
-                end_event = create_event(
-                    EventKind.ROUND_ENDED,
-                    {
-                        "reason": "turn_limit_reached",
-                        "elapsed_seconds": game_state.timer or 0,
-                        "red_turns": red_turn_count,
-                        "blue_turns": blue_turn_count,
-                        "max_turns_per_side": max_turns,
-                    }
-                )
-                await broadcaster.emit_to_all(end_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(end_event)
-            else:
-                # Switch to Blue team
-                old_turn = game_state.current_turn
-                game_state.current_turn = "blue"
-                game_state.turn_start_time = datetime.utcnow()
-                game_state.blue_action_this_turn = False
-                print(f"[SCAN] Turn changed from {old_turn} to Blue after vulnerability identification at {game_state.turn_start_time.isoformat()}")
-                
-                # Emit turn_changed event
-                turn_event = create_event(
-                    EventKind.TURN_CHANGED,
-                    {
-                        "turn": "blue",
-                        "reason": "vulnerability_identified",
-                        "previous_turn": old_turn,
-                        "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                    }
-                )
-                print(f"[SCAN] Emitting TURN_CHANGED event: turn=blue, reason=vulnerability_identified")
-                await broadcaster.emit_to_all(turn_event)
-                
-                if settings.FEATURE_WS_SNAPSHOT:
-                    from app.store import add_event
-                    add_event(turn_event)
-        else:
-            # No turn limit, proceed normally
-            old_turn = game_state.current_turn
-            game_state.current_turn = "blue"
-            game_state.turn_start_time = datetime.utcnow()
-            game_state.blue_action_this_turn = False
-            print(f"[SCAN] Turn changed from {old_turn} to Blue after vulnerability identification at {game_state.turn_start_time.isoformat()}")
-            
-            # Emit turn_changed event
-            turn_event = create_event(
-                EventKind.TURN_CHANGED,
-                {
-                    "turn": "blue",
-                    "reason": "vulnerability_identified",
-                    "previous_turn": old_turn,
-                    "turn_start_time": game_state.turn_start_time.isoformat() if game_state.turn_start_time else None,
-                }
-            )
-            print(f"[SCAN] Emitting TURN_CHANGED event: turn=blue, reason=vulnerability_identified")
-            await broadcaster.emit_to_all(turn_event)
-            
-            if settings.FEATURE_WS_SNAPSHOT:
-                from app.store import add_event
-                add_event(turn_event)
+        if settings.FEATURE_WS_SNAPSHOT:
+            add_events(turn_events)
     
     return {
         "success": True,
@@ -800,8 +465,8 @@ async def run_scan(request: ScanRequest) -> ScanResult:
     """Run a reconnaissance scan."""
     game_state = game.game_state
     
-    print(f"[SCAN] Scan request: tool={request.tool}, target={request.target_node}, scenario={request.scenario_id}")
-    print(f"[SCAN] Game state: scenario={game_state.current_scenario_id}, status={game_state.status}")
+    logger.debug("[SCAN] Scan request: tool=%s, target=%s, scenario=%s", request.tool, request.target_node, request.scenario_id)
+    logger.debug("[SCAN] Game state: scenario=%s, status=%s", game_state.current_scenario_id, game_state.status)
     
     if game_state.status != GameStatus.RUNNING:
         raise HTTPException(
@@ -843,20 +508,17 @@ async def run_scan(request: ScanRequest) -> ScanResult:
     
     # Generate a random source IP address for this scan
     # Use realistic private/public IP ranges
-    scan_source_ip = f"{random.randint(198, 203)}.{random.randint(51, 99)}.{random.randint(100, 255)}.{random.randint(1, 254)}"
+    scan_source_ip = random_source_ip()
     
-    # Initialize scan IPs list if needed
-    if not hasattr(game_state, 'red_scan_ips') or game_state.red_scan_ips is None:
-        game_state.red_scan_ips = []
-    
-    # Add IP to scan IPs list if not already there (avoid duplicates)
-    if scan_source_ip not in game_state.red_scan_ips:
-        game_state.red_scan_ips.append(scan_source_ip)
+    # Add IP to scan IPs (a set, so duplicates are ignored)
+    game_state.red_scan_ips.add(scan_source_ip)
     
     # Get scan results based on tool
     scan_results = get_scan_results(request.tool, scenario, is_correct_tool)
     
-    # Create scan result
+    # Create scan result (one clock read for the result, its alert and its events)
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
     scan_id = str(uuid.uuid4())
     scan_result = ScanResult(
         scan_id=scan_id,
@@ -864,7 +526,7 @@ async def run_scan(request: ScanRequest) -> ScanResult:
         target_node=request.target_node,
         success=is_correct_tool,
         results=scan_results,
-        timestamp=datetime.utcnow(),
+        timestamp=now,
         message=get_scan_message(request.tool, is_correct_tool, scenario),
         player_name=request.player_name,
     )
@@ -882,22 +544,18 @@ async def run_scan(request: ScanRequest) -> ScanResult:
         "target_node": request.target_node,
         "success": is_correct_tool,
         "results": scan_results,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso,
         "message": get_scan_message(request.tool, is_correct_tool, scenario),
         "player_name": request.player_name,
         "source_ip": scan_source_ip,  # Store source IP for this scan
     }
     
-    # Initialize list if it doesn't exist
-    if not hasattr(game_state, 'red_scan_results') or game_state.red_scan_results is None:
-        game_state.red_scan_results = []
-    
     # Only add if this scan_id doesn't already exist (prevent duplicates)
     existing_scan_ids = [s.get("scan_id") for s in game_state.red_scan_results if isinstance(s, dict)]
     if scan_id not in existing_scan_ids:
         game_state.red_scan_results.append(scan_result_dict)
     
-    print(f"[SCAN] Updated game state: red_scan_completed={game_state.red_scan_completed}, total_scans={len(game_state.red_scan_results)}")
+    logger.debug("[SCAN] Updated game state: red_scan_completed=%s, total_scans=%s", game_state.red_scan_completed, len(game_state.red_scan_results))
     # Note: Removed red_scan_this_turn flag - multiple scans allowed per turn
     
     # Award/penalize points for scan choice
@@ -907,42 +565,37 @@ async def run_scan(request: ScanRequest) -> ScanResult:
     if is_correct_tool:
         # Correct scan tool chosen (matches scenario's required_scan_tool) - award points
         scan_points = 2
-        print(f"[SCAN] Correct scan tool chosen: +{scan_points} points")
+        logger.debug("[SCAN] Correct scan tool chosen: +%s points", scan_points)
         current_score.red = max(0, current_score.red + scan_points)
     elif is_linked_to_attack:
         # Wrong scan tool chosen but it's linked to an attack - minor penalty
         scan_points = -1
-        print(f"[SCAN] Wrong scan tool chosen (linked to attack): {scan_points} points")
+        logger.debug("[SCAN] Wrong scan tool chosen (linked to attack): %s points", scan_points)
         current_score.red = max(0, current_score.red + scan_points)
     else:
         # Informational scan (not linked to any attack) - no points awarded or penalized
-        print(f"[SCAN] Informational scan (not linked to attack) - no points awarded or penalized")
+        logger.debug("[SCAN] Informational scan (not linked to attack) - no points awarded or penalized")
     
     # Emit score update if points changed
     if scan_points != 0:
         score_event = create_event(
             EventKind.SCORE_UPDATE,
-            {
-                "red": current_score.red,
-                "blue": current_score.blue,
-                "mttd": current_score.mttd,
-                "mttc": current_score.mttc,
-            },
+            current_score.snapshot(),
+            server_ts=now,
         )
         await broadcaster.emit_to_all(score_event)
         
         if settings.FEATURE_WS_SNAPSHOT:
-            from app.store import add_event
             add_event(score_event)
     
-    print(f"[SCAN] Scan completed: tool={request.tool}, success={is_correct_tool}, points={scan_points}, source_ip={scan_source_ip}")
+    logger.debug("[SCAN] Scan completed: tool=%s, success=%s, points=%s, source_ip=%s", request.tool, is_correct_tool, scan_points, scan_source_ip)
     
     # Generate scan alert for Blue team to see scan activity
     from app.models import Alert
     from datetime import timedelta
     scan_alert = Alert(
         id=f"scan-alert-{scan_id}",
-        timestamp=datetime.utcnow(),
+        timestamp=now,
         source="WAF",
         severity="medium",
         summary=f"Suspicious scanning activity detected from {scan_source_ip}",
@@ -956,14 +609,15 @@ async def run_scan(request: ScanRequest) -> ScanResult:
         EventKind.ALERT_EMITTED,
         {
             "alert_id": scan_alert.id,
-            "timestamp": scan_alert.timestamp.isoformat(),
+            "timestamp": scan_alert.timestamp,  # Converted when the event is serialized
             "source": scan_alert.source,
             "severity": scan_alert.severity,
             "summary": scan_alert.summary,
             "details": scan_alert.details,
-            "ioc": scan_alert.ioc,
+            "ioc": scan_alert.ioc.model_dump(mode="json"),
             "confidence": scan_alert.confidence,
         },
+        server_ts=now,
     )
     await broadcaster.emit_to_all(scan_alert_event)
     
@@ -980,15 +634,15 @@ async def run_scan(request: ScanRequest) -> ScanResult:
             "player_name": request.player_name,
             "results": scan_results,
             "message": get_scan_message(request.tool, is_correct_tool, scenario),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "source_ip": scan_source_ip,  # Include source IP in event
         },
+        server_ts=now,
     )
     await broadcaster.emit_to_all(scan_event)
     
     # Store event if snapshot feature is enabled
     if settings.FEATURE_WS_SNAPSHOT:
-        from app.store import add_event
         add_event(scan_event)
     
     return scan_result
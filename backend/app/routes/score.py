@@ -17,7 +17,9 @@ async def get_score() -> Score:
 @router.post("/reset")
 async def reset_score() -> Score:
     """Reset score."""
-    global current_score
-    current_score = Score()
+    # Reset in place: other route modules hold a reference to current_score
+    fresh = Score()
+    for field in Score.model_fields:
+        setattr(current_score, field, getattr(fresh, field))
     return current_score
 
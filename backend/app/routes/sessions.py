@@ -14,6 +14,7 @@ from app.models import (
 )
 from app.settings import settings
 from app.services.auth import create_access_token
+from app.services.rate_limit import SlidingWindowRateLimiter
 from app.routes.auth import require_role, get_current_user, get_client_ip
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
@@ -23,7 +24,37 @@ _sessions: dict[str, GameSession] = {}
 _code_to_session: dict[str, tuple[str, str]] = {}  # code -> (session_id, role)
 # Lock for session creation to prevent race conditions
 import asyncio
+import heapq
 _session_lock = asyncio.Lock()
+# Min-heap of (monotonic expiry, session_id) so expiry checks only touch expired sessions
+_expiry_heap: list[tuple[float, str]] = []
+
+
+def _remove_session(session_id: str):
+    """Drop a session and its join codes from the in-memory store."""
+    session = _sessions.pop(session_id)
+    for code in (session.red_code, session.blue_code, session.audience_code):
+        _code_to_session.pop(code, None)
+
+
+def sweep_expired() -> list[str]:
+    """
+    Remove sessions whose expiry has passed, popping only expired heap entries.
+    
+    Heap entries for sessions already removed elsewhere are discarded lazily.
+    
+    Returns:
+        IDs of the sessions removed by this sweep
+    """
+    now = time.monotonic()
+    removed = []
+    while _expiry_heap and _expiry_heap[0][0] < now:
+        _, session_id = heapq.heappop(_expiry_heap)
+        if session_id in _sessions:
+            _remove_session(session_id)
+            removed.append(session_id)
+            print(f"[SESSIONS] Removed expired session {session_id}")
+    return removed
 
 
 async def cleanup_expired_sessions():
@@ -139,30 +170,14 @@ def update_session_state_by_game_status(game_status: str, gm_user_id: Optional[s
                 print(f"[SESSIONS] Updated session {session.id} state: {old_state} -> lobby")
 
 # Simple rate limiting (in-memory, per IP)
-_rate_limit_store: dict[str, list[float]] = {}
 RATE_LIMIT_WINDOW = 60  # 1 minute
 RATE_LIMIT_MAX_REQUESTS = 10  # Increased from 5 to 10 for better multi-device support
+_rate_limiter = SlidingWindowRateLimiter(RATE_LIMIT_WINDOW, RATE_LIMIT_MAX_REQUESTS)
 
 
 def check_rate_limit(ip: str) -> bool:
-    """Check if IP is within rate limit."""
-    now = time.time()
-    if ip not in _rate_limit_store:
-        _rate_limit_store[ip] = []
-    
-    # Remove old requests outside window
-    _rate_limit_store[ip] = [
-        req_time for req_time in _rate_limit_store[ip]
-        if now - req_time < RATE_LIMIT_WINDOW
-    ]
-    
-    # Check if limit exceeded
-    if len(_rate_limit_store[ip]) >= RATE_LIMIT_MAX_REQUESTS:
-        return False
-    
-    # Add current request
-    _rate_limit_store[ip].append(now)
-    return True
+    """Check if IP is within rate limit (and count this request if so)."""
+    return _rate_limiter.allow(ip)
 
 
 def generate_join_code(prefix: str = "") -> str:
@@ -308,6 +323,7 @@ async def create_session(
         
         # Create session
         session_id = f"sess_{secrets.token_urlsafe(8)}"
+        session_ttl = timedelta(hours=24)  # 24 hour expiry
         session = GameSession(
             id=session_id,
             state="lobby",
@@ -316,11 +332,12 @@ async def create_session(
             audience_code=audience_code,
             created_at=datetime.utcnow(),
             created_by=user.sub,
-            expires_at=datetime.utcnow() + timedelta(hours=24)  # 24 hour expiry
+            expires_at=datetime.utcnow() + session_ttl  # Kept for API display
         )
         
         # Store session
         _sessions[session_id] = session
+        heapq.heappush(_expiry_heap, (time.monotonic() + session_ttl.total_seconds(), session_id))
         _code_to_session[red_code] = (session_id, "RED")
         _code_to_session[blue_code] = (session_id, "BLUE")
         _code_to_session[audience_code] = (session_id, "AUDIENCE")
@@ -37,7 +37,7 @@ async def get_timeline(
         filtered_events = recent_events
     
     return {
-        "events": [e.model_dump() for e in filtered_events],
+        "events": [e.model_dump(mode="json") for e in filtered_events],
         "count": len(filtered_events),
         "server_ts": datetime.utcnow().isoformat(),
     }
@@ -2,7 +2,7 @@
 import random
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-from app.models import Attack, AttackType, Scenario, Alert
+from app.models import Attack, AttackType, Scenario, Alert, IOC
 
 
 def generate_alerts(
@@ -105,9 +105,8 @@ def generate_alerts(
         if scenario.hint_deck and i < len(scenario.hint_deck):
             hint_ref = f"hint-{scenario.hint_deck[i].step}"
         
-        # Build IOC dict - merge template IOC with default IOC
-        ioc = template.get("ioc", {})
-        ioc.update({"ip": "198.51.100.7", "target": attack.to_node})
+        # Build IOC - merge template IOC with default IOC
+        ioc = IOC(**{**template.get("ioc", {}), "ip": "198.51.100.7", "target": attack.to_node})
         
         # Get details - use template details if available, otherwise use default
         details = template.get("details", f"Attack {attack.id} targeting {attack.to_node}")
@@ -142,7 +141,7 @@ def generate_alerts(
                 severity=random.choice(noise_severities),
                 summary="Benign traffic anomaly",
                 details="False positive alert",
-                ioc={},
+                ioc=IOC(),
                 confidence=random.uniform(0.3, 0.5),
             )
             alerts.append(noise_alert)
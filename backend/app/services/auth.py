@@ -1,6 +1,8 @@
 """Authentication utilities (only used if FEATURE_AUTH_GM is True)."""
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
+import hashlib
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.settings import settings
@@ -8,6 +10,10 @@ from app.settings import settings
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Verified token payloads keyed by blake2b(token) (raw tokens are never stored)
+_TOKEN_CACHE_MAX = 4096
+_token_cache: Dict[bytes, dict] = {}
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
@@ -37,16 +43,34 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 
 def decode_access_token(token: str) -> Optional[dict]:
-    """Decode and verify a JWT access token."""
+    """
+    Decode and verify a JWT access token.
+    
+    Verified payloads are memoized until their exp, so reconnect storms with the
+    same token skip signature verification.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if cached.get("exp", 0) > time.time():
+            return dict(cached)
+        del _token_cache[key]
+    
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET,
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
+    
+    if "exp" in payload:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[key] = payload
+    return dict(payload)
 
 
 def verify_gm_credentials(username: str, password: str) -> bool:
@@ -0,0 +1,42 @@
+"""In-memory per-IP sliding-window rate limiting."""
+import time
+from collections import deque
+from typing import Dict
+
+
+class SlidingWindowRateLimiter:
+    """At most max_requests per window_seconds per IP, tracked with one deque per IP."""
+    
+    def __init__(self, window_seconds: float, max_requests: int):
+        self.window = window_seconds
+        self.max_requests = max_requests
+        # ip -> request times (monotonic), oldest first
+        self._requests: Dict[str, deque] = {}
+        self._next_sweep = time.monotonic() + window_seconds
+    
+    def allow(self, ip: str) -> bool:
+        """Record a request from ip; False if it is over the limit (the request is not counted)."""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+        
+        requests = self._requests.get(ip)
+        if requests is None:
+            requests = self._requests[ip] = deque()
+        
+        # Drop requests that fell out of the window (oldest first, so stop at the first recent one)
+        while requests and now - requests[0] >= self.window:
+            requests.popleft()
+        
+        if len(requests) >= self.max_requests:
+            return False
+        
+        requests.append(now)
+        return True
+    
+    def _sweep(self, now: float):
+        """Forget IPs with no requests in the window (at most once per window)."""
+        idle = [ip for ip, requests in self._requests.items() if not requests or now - requests[-1] >= self.window]
+        for ip in idle:
+            del self._requests[ip]
+        self._next_sweep = now + self.window
@@ -1,6 +1,9 @@
 """Attack resolution logic."""
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
+import functools
+import logging
+import re
 from app.models import (
     Attack,
     BlueAction,
@@ -13,6 +16,18 @@ from app.models import (
 )
 from app.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# Note keywords that count as attributing an attack (the attack's own type is added per resolution)
+ATTRIBUTION_TERMS = ("attack", "rce", "sqli", "sql", "brute", "phish", "lateral", "exfil")
+
+
+@functools.lru_cache(maxsize=None)
+def attribution_pattern(attack_type: str) -> re.Pattern:
+    """Case-insensitive alternation of ATTRIBUTION_TERMS plus the attack's own type (one scan per note)."""
+    terms = sorted({*ATTRIBUTION_TERMS, attack_type.lower()})
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
 
 def resolve_outcome_legacy(
     attack: Attack,
@@ -35,14 +50,14 @@ def resolve_outcome_legacy(
     # We still check for completeness, but this should rarely trigger
     
     # Check if this is the correct attack choice for the scenario
-    is_correct_attack = getattr(attack, 'is_correct_choice', False)
+    is_correct_attack = attack.is_correct_choice
     
     # If attack is not the correct choice, it's a miss (should have been caught at launch)
     if not is_correct_attack:
         result = "miss"
         score_deltas = {"red": 0, "blue": 0}
         
-        print(f"[RESOLVER] Attack {attack.id} is not the correct choice - result: miss (should have been caught at launch)")
+        logger.debug("[RESOLVER] Attack %s is not the correct choice - result: miss (should have been caught at launch)", attack.id)
         
         return {
             "result": result,
@@ -60,21 +75,25 @@ def resolve_outcome_legacy(
     correct_attribution = False
     contained_quickly = False
     
-    print(f"[RESOLVER] Resolving attack: {attack.id}, type: {attack.attack_type}, from: {attack.from_node}, to: {attack.to_node}")
-    print(f"[RESOLVER] Blue actions: {len(blue_actions)}")
-    for i, action in enumerate(blue_actions):
-        print(f"[RESOLVER] Action {i}: type={action.type}, target={action.target}, note={action.note}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[RESOLVER] Resolving attack: %s, type: %s, from: %s, to: %s", attack.id, attack.attack_type, attack.from_node, attack.to_node)
+        logger.debug("[RESOLVER] Blue actions: %s", len(blue_actions))
+        for i, action in enumerate(blue_actions):
+            logger.debug("[RESOLVER] Action %s: type=%s, target=%s, note=%s", i, action.type, action.target, action.note)
+    
+    # Attribution terms for this attack (compiled once per attack type)
+    attribution = attribution_pattern(attack.attack_type.value)
     
     for action in blue_actions:
         # Check for blocking actions - match target node or related nodes
         # Also check if action type matches attack type
         action_targets_node = (attack.to_node == action.target or attack.from_node == action.target)
         
-        print(f"[RESOLVER] Checking action: type={action.type}, target={action.target} against attack to={attack.to_node}, from={attack.from_node}")
-        print(f"[RESOLVER] Action targets node: {action_targets_node}")
+        logger.debug("[RESOLVER] Checking action: type=%s, target=%s against attack to=%s, from=%s", action.type, action.target, attack.to_node, attack.from_node)
+        logger.debug("[RESOLVER] Action targets node: %s", action_targets_node)
         
         if action_targets_node:
-            print(f"[RESOLVER] Action targets node, checking blocking rules...")
+            logger.debug("[RESOLVER] Action targets node, checking blocking rules...")
             
             # Host isolation blocks most attacks (including lateral movement and exfil)
             if action.type in [BlueActionType.ISOLATE_HOST, BlueActionType.BLOCK_IP]:
@@ -84,11 +103,11 @@ def resolve_outcome_legacy(
                         blocked = True
                         result = "blocked"
                         score_deltas["blue"] += 8  # Blocked pre-detonation
-                        print(f"[RESOLVER] ✓ Attack BLOCKED by {action.type} on {action.target}")
+                        logger.debug("[RESOLVER] ✓ Attack BLOCKED by %s on %s", action.type, action.target)
                     else:
-                        print(f"[RESOLVER] Attack already blocked by previous action")
+                        logger.debug("[RESOLVER] Attack already blocked by previous action")
                 else:
-                    print(f"[RESOLVER] {action.type} does not block {attack.attack_type}")
+                    logger.debug("[RESOLVER] %s does not block %s", action.type, attack.attack_type)
             
             # WAF update blocks web attacks
             elif action.type == BlueActionType.UPDATE_WAF:
@@ -98,11 +117,11 @@ def resolve_outcome_legacy(
                         blocked = True
                         result = "blocked"
                         score_deltas["blue"] += 8
-                        print(f"[RESOLVER] ✓ Attack BLOCKED by WAF update on {action.target}")
+                        logger.debug("[RESOLVER] ✓ Attack BLOCKED by WAF update on %s", action.target)
                     else:
-                        print(f"[RESOLVER] Attack already blocked by previous action")
+                        logger.debug("[RESOLVER] Attack already blocked by previous action")
                 else:
-                    print(f"[RESOLVER] WAF update does not block {attack.attack_type}")
+                    logger.debug("[RESOLVER] WAF update does not block %s", attack.attack_type)
             
             # Block domain/IP can block certain attacks
             elif action.type == BlueActionType.BLOCK_DOMAIN:
@@ -112,30 +131,29 @@ def resolve_outcome_legacy(
                         blocked = True
                         result = "blocked"
                         score_deltas["blue"] += 6
-                        print(f"[RESOLVER] ✓ Attack BLOCKED by domain block on {action.target}")
+                        logger.debug("[RESOLVER] ✓ Attack BLOCKED by domain block on %s", action.target)
                     else:
-                        print(f"[RESOLVER] Attack already blocked by previous action")
+                        logger.debug("[RESOLVER] Attack already blocked by previous action")
                 else:
-                    print(f"[RESOLVER] Domain block does not block {attack.attack_type}")
+                    logger.debug("[RESOLVER] Domain block does not block %s", attack.attack_type)
             else:
-                print(f"[RESOLVER] Action type {action.type} does not have blocking rules (may be informational or other action)")
+                logger.debug("[RESOLVER] Action type %s does not have blocking rules (may be informational or other action)", action.type)
         
         # Check attribution - more lenient matching
         if action.note:
-            note_lower = action.note.lower()
-            attack_type_lower = attack.attack_type.value.lower()
-            if any(term in note_lower for term in [attack_type_lower, "attack", "rce", "sqli", "sql", "brute", "phish", "lateral", "exfil"]):
+            if attribution.search(action.note):
                 correct_attribution = True
-                print(f"[RESOLVER] ✓ Correct attribution detected in note: {action.note}")
+                logger.debug("[RESOLVER] ✓ Correct attribution detected in note: %s", action.note)
     
     # Check containment timing
     if blue_actions and clock > 0:
-        action_times = [(datetime.utcnow() - action.timestamp).total_seconds() for action in blue_actions]
-        if min(action_times) < 300:  # 5 minutes
+        # Time since the most recent action (one clock read, no per-action timedelta)
+        since_latest = (datetime.utcnow() - max(action.timestamp for action in blue_actions)).total_seconds()
+        if since_latest < 300:  # 5 minutes
             contained_quickly = True
-            print(f"[RESOLVER] ✓ Quick containment detected: {min(action_times):.1f}s")
+            logger.debug("[RESOLVER] ✓ Quick containment detected: %.1fs", since_latest)
     
-    print(f"[RESOLVER] Final result: {result}, blocked: {blocked}")
+    logger.debug("[RESOLVER] Final result: %s, blocked: %s", result, blocked)
     
     # Red team scoring - only if attack hits (not blocked)
     if result == "hit":
@@ -200,7 +218,7 @@ def resolve_outcome_legacy(
         "score_deltas": score_deltas,
         "emitted_alerts": emitted_alerts,
     }
-    print(f"[RESOLVER] Returning outcome: {final_result}")
+    logger.debug("[RESOLVER] Returning outcome: %s", final_result)
     return final_result
 
 
@@ -616,7 +634,7 @@ def resolve_outcome_tiered(
     # Determine if attack has succeeded
     attack_succeeded, success_indicators = determine_attack_success(attack, alerts)
     
-    print(f"[RESOLVER] Attack {attack.id} success state: {attack_succeeded}, indicators: {success_indicators}")
+    logger.debug("[RESOLVER] Attack %s success state: %s, indicators: %s", attack.id, attack_succeeded, success_indicators)
     
     # Evaluate each action
     action_evaluations = []
@@ -626,7 +644,7 @@ def resolve_outcome_tiered(
         evaluation = evaluate_action_tiered(action, attack, attack_succeeded, alerts)
         action_evaluations.append(evaluation)
         total_blue_points += evaluation.points
-        print(f"[RESOLVER] Action {action.id}: {evaluation.effectiveness}, {evaluation.points} points - {evaluation.reason}")
+        logger.debug("[RESOLVER] Action %s: %s, %s points - %s", action.id, evaluation.effectiveness, evaluation.points, evaluation.reason)
     
     # Determine overall result
     optimal_actions = [e for e in action_evaluations if e.effectiveness == "optimal"]
@@ -665,15 +683,15 @@ def resolve_outcome_tiered(
         elif attack.attack_type == AttackType.EXFIL:
             red_points = 5
     
-    print(f"[RESOLVER] Final result: {overall_result}, red execution points: {red_points}, blue: {total_blue_points}")
+    logger.debug("[RESOLVER] Final result: %s, red execution points: %s, blue: %s", overall_result, red_points, total_blue_points)
     
     return {
         "result": overall_result,
         "attack_succeeded": attack_succeeded,
         "success_indicators": success_indicators,
         "score_deltas": {"red": red_points, "blue": total_blue_points},
-        "action_evaluations": [e.model_dump() for e in action_evaluations],
-        "emitted_alerts": [a.model_dump() if hasattr(a, 'model_dump') else a for a in alerts],
+        "action_evaluations": [e.model_dump(mode="json") for e in action_evaluations],
+        "emitted_alerts": [a.model_dump(mode="json") if hasattr(a, 'model_dump') else a for a in alerts],
     }
 
 
@@ -695,7 +713,7 @@ def resolve_outcome(
         try:
             return resolve_outcome_tiered(attack, blue_actions, posture, clock, alerts, attack_instance)
         except Exception as e:
-            print(f"[RESOLVER] Tiered resolution failed, falling back to legacy: {e}")
+            logger.warning("[RESOLVER] Tiered resolution failed, falling back to legacy: %s", e)
             return resolve_outcome_legacy(attack, blue_actions, posture, clock)
     
     # Fallback to SLA-aware or legacy
@@ -703,7 +721,7 @@ def resolve_outcome(
         try:
             return resolve_outcome_with_sla(attack, blue_actions, posture, clock, attack_instance)
         except Exception as e:
-            print(f"[RESOLVER] SLA resolution failed, falling back to legacy: {e}")
+            logger.warning("[RESOLVER] SLA resolution failed, falling back to legacy: %s", e)
             return resolve_outcome_legacy(attack, blue_actions, posture, clock)
     else:
         # Legacy path (default fallback)
@@ -1,5 +1,4 @@
 """Seed data loader."""
-import json
 from pathlib import Path
 from typing import Dict, Any
 from app.models import (
@@ -0,0 +1,22 @@
+"""Random attacker source IPs for scans and attack launches."""
+import random
+
+# Octet ranges (inclusive) for generated source IPs: 198-203.51-99.100-255.1-254
+_OCTET_RANGES = ((198, 203), (51, 99), (100, 255), (1, 254))
+_OCTET_SPANS = tuple(high - low + 1 for low, high in _OCTET_RANGES)
+_OCTET_LOWS = tuple(low for low, _ in _OCTET_RANGES)
+_IP_SPACE = _OCTET_SPANS[0] * _OCTET_SPANS[1] * _OCTET_SPANS[2] * _OCTET_SPANS[3]
+
+
+def random_source_ip() -> str:
+    """
+    Random source IP within _OCTET_RANGES.
+    
+    One random draw split into octets (mixed radix) instead of one randint per octet;
+    every address in the space stays equally likely.
+    """
+    n = random.randrange(_IP_SPACE)
+    n, d = divmod(n, _OCTET_SPANS[3])
+    n, c = divmod(n, _OCTET_SPANS[2])
+    a, b = divmod(n, _OCTET_SPANS[1])
+    return f"{_OCTET_LOWS[0] + a}.{_OCTET_LOWS[1] + b}.{_OCTET_LOWS[2] + c}.{_OCTET_LOWS[3] + d}"
@@ -18,6 +18,7 @@ async def timer_loop():
     # Lazy import to avoid circular dependency - import once at function start
     from app.routes.game import game_state
     from app.ws import broadcaster, create_event
+    from app.store import add_event, add_events
     
     while True:
         try:
@@ -25,13 +26,14 @@ async def timer_loop():
             
             # Only update timer if game is running and briefing has been dismissed (start_time is set)
             if game_state.status == GameStatus.RUNNING and game_state.start_time and game_state.red_briefing_dismissed:
-                # Calculate elapsed time
-                elapsed = int((datetime.utcnow() - game_state.start_time).total_seconds())
+                # Calculate elapsed time (one clock read per tick, shared by the turn checks below)
+                now = datetime.utcnow()
+                elapsed = int((now - game_state.start_time).total_seconds())
                 game_state.timer = elapsed
                 
                 # Check for turn timeout
                 if game_state.current_turn and game_state.turn_start_time:
-                    turn_elapsed = int((datetime.utcnow() - game_state.turn_start_time).total_seconds())
+                    turn_elapsed = int((now - game_state.turn_start_time).total_seconds())
                     turn_remaining = max(0, game_state.turn_time_limit - turn_elapsed)
                     
                     # Check if turn time has expired (>= to catch exactly at limit and any overshoot)
@@ -39,12 +41,6 @@ async def timer_loop():
                     if turn_elapsed >= game_state.turn_time_limit:
                         print(f"[TIMER] Turn timeout reached for {game_state.current_turn} team (elapsed: {turn_elapsed}s, limit: {game_state.turn_time_limit}s)")
                         
-                        # Initialize turn counters if they don't exist (defensive check for backwards compatibility)
-                        if not hasattr(game_state, 'red_turn_count'):
-                            game_state.red_turn_count = 0
-                        if not hasattr(game_state, 'blue_turn_count'):
-                            game_state.blue_turn_count = 0
-                        
                         # Increment turn counter for the expired turn
                         old_turn = game_state.current_turn
                         if old_turn == "red":
@@ -55,10 +51,10 @@ async def timer_loop():
                             print(f"[TIMER] Blue team turn count: {game_state.blue_turn_count}")
                         
                         # Check if both teams have completed their turns
-                        max_turns = getattr(game_state, 'max_turns_per_side', None)
+                        max_turns = game_state.max_turns_per_side
                         if max_turns:
-                            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-                            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
+                            red_turn_count = game_state.red_turn_count
+                            blue_turn_count = game_state.blue_turn_count
                             red_done = red_turn_count >= max_turns
                             blue_done = blue_turn_count >= max_turns
                             
@@ -80,7 +76,6 @@ async def timer_loop():
                                 await broadcaster.emit_to_all(end_event)
                                 
                                 if settings.FEATURE_WS_SNAPSHOT:
-                                    from app.store import add_event
                                     add_event(end_event)
                                 
                                 # Don't advance turn, game is over
@@ -91,8 +86,8 @@ async def timer_loop():
                         
                         # If the new turn's team has used all their turns, skip to the other team
                         if max_turns:
-                            red_turn_count = getattr(game_state, 'red_turn_count', 0)
-                            blue_turn_count = getattr(game_state, 'blue_turn_count', 0)
+                            red_turn_count = game_state.red_turn_count
+                            blue_turn_count = game_state.blue_turn_count
                             if new_turn == "red" and red_turn_count >= max_turns:
                                 print(f"[TIMER] Red team has used all {max_turns} turns, skipping to Blue")
                                 new_turn = "blue"
@@ -101,7 +96,7 @@ async def timer_loop():
                                 new_turn = "red"
                         
                         game_state.current_turn = new_turn
-                        game_state.turn_start_time = datetime.utcnow()  # Reset timer for new turn
+                        game_state.turn_start_time = now  # Reset timer for new turn
                         # Reset per-turn action limits
                         # Note: Removed red_scan_this_turn reset - scans no longer restricted by turn
                         game_state.red_attack_this_turn = False
@@ -121,7 +116,6 @@ async def timer_loop():
                             }
                         )
                         print(f"[TIMER] Emitting TURN_TIMEOUT event: expired={old_turn}, new={new_turn}")
-                        await broadcaster.emit_to_all(timeout_event)
                         
                         # Emit turn changed event with updated state
                         turn_event = create_event(
@@ -134,13 +128,12 @@ async def timer_loop():
                             }
                         )
                         print(f"[TIMER] Emitting TURN_CHANGED event: turn={new_turn}, reason=turn_timeout")
-                        await broadcaster.emit_to_all(turn_event)
+                        # Timeout then turn change, in order, in one pass over the clients
+                        await broadcaster.emit_many_to_all([timeout_event, turn_event])
                         
                         # Store events if snapshot feature is enabled
                         if settings.FEATURE_WS_SNAPSHOT:
-                            from app.store import add_event
-                            add_event(timeout_event)
-                            add_event(turn_event)
+                            add_events([timeout_event, turn_event])
                 else:
                     # Log when turn timeout check is skipped
                     if game_state.current_turn and not game_state.turn_start_time:
@@ -164,14 +157,12 @@ async def timer_loop():
                             "limit_seconds": SCENARIO_DURATION_LIMIT,
                         }
                     )
-                    await broadcaster.emit_to_all(end_event)
                     
                     # Store event if snapshot feature is enabled
                     if settings.FEATURE_WS_SNAPSHOT:
-                        from app.store import add_event
                         add_event(end_event)
                     
-                    # Emit timer update with final time
+                    # Emit timer update with final time (sent with round_ended in one pass)
                     timer_event = create_event(
                         EventKind.TIMER_UPDATE,
                         {
@@ -180,7 +171,7 @@ async def timer_loop():
                             "time_remaining": 0,
                         }
                     )
-                    await broadcaster.emit_to_all(timer_event)
+                    await broadcaster.emit_many_to_all([end_event, timer_event])
                 else:
                     # Emit timer update event (every 5 seconds to reduce WebSocket traffic)
                     if elapsed % 5 == 0:
@@ -0,0 +1,89 @@
+"""Turn progression shared by the routes that end a side's turn."""
+from datetime import datetime
+from typing import List, Optional
+import logging
+from app.models import Event, EventKind, GameState, GameStatus
+from app.ws import create_event
+
+logger = logging.getLogger(__name__)
+
+
+def turn_changed_event(turn: str, reason: str, previous_turn: str, turn_start_time: Optional[datetime], now: Optional[datetime] = None) -> Event:
+    """turn_changed event announcing the side whose turn started at turn_start_time."""
+    return create_event(
+        EventKind.TURN_CHANGED,
+        {
+            "turn": turn,
+            "reason": reason,
+            "previous_turn": previous_turn,
+            "turn_start_time": turn_start_time.isoformat() if turn_start_time else None,
+        },
+        server_ts=now,
+    )
+
+
+def turn_limit_event(game_state: GameState, now: Optional[datetime] = None) -> Event:
+    """round_ended event for a round that ran out of turns (max_turns_per_side each)."""
+    return create_event(
+        EventKind.ROUND_ENDED,
+        {
+            "reason": "turn_limit_reached",
+            "elapsed_seconds": game_state.timer or 0,
+            "red_turns": game_state.red_turn_count,
+            "blue_turns": game_state.blue_turn_count,
+            "max_turns_per_side": game_state.max_turns_per_side,
+        },
+        server_ts=now,
+    )
+
+
+def advance_blue_turn(game_state: GameState, reason: str, now: Optional[datetime] = None) -> List[Event]:
+    """
+    Count Blue's completed turn, then end the round or hand the turn to Red.
+    
+    The round ends once both sides have used max_turns_per_side (if the scenario sets
+    one). Returns the round_ended / turn_changed event for the caller to broadcast.
+    Callers check that it is Blue's turn first.
+    """
+    now = now or datetime.utcnow()
+    game_state.blue_turn_count += 1
+    logger.debug("[TURN] Blue team turn count: %s", game_state.blue_turn_count)
+    
+    max_turns = game_state.max_turns_per_side
+    if max_turns and game_state.red_turn_count >= max_turns and game_state.blue_turn_count >= max_turns:
+        logger.debug("[TURN] Both teams have completed their turns (%s each). Ending round.", max_turns)
+        game_state.status = GameStatus.FINISHED
+        return [turn_limit_event(game_state, now)]
+    
+    old_turn = game_state.current_turn
+    game_state.current_turn = "red"
+    game_state.turn_start_time = now  # Start Red's turn timer
+    # Reset Red's action limits for the new turn
+    game_state.red_attack_this_turn = False
+    logger.debug("[TURN] Turn changed from %s to Red (%s) at %s", old_turn, reason, game_state.turn_start_time)
+    return [turn_changed_event("red", reason, old_turn, game_state.turn_start_time, now)]
+
+
+def advance_red_turn(game_state: GameState, reason: str, now: Optional[datetime] = None) -> List[Event]:
+    """
+    Count Red's completed turn, then end the round or hand the turn to Blue.
+    
+    Mirror of advance_blue_turn. Callers check that it is Red's turn first.
+    """
+    now = now or datetime.utcnow()
+    game_state.red_turn_count += 1
+    logger.debug("[TURN] Red team turn count: %s", game_state.red_turn_count)
+    
+    max_turns = game_state.max_turns_per_side
+    if max_turns and game_state.red_turn_count >= max_turns and game_state.blue_turn_count >= max_turns:
+        logger.debug("[TURN] Both teams have completed their turns (%s each). Ending round.", max_turns)
+        game_state.status = GameStatus.FINISHED
+        return [turn_limit_event(game_state, now)]
+    
+    old_turn = game_state.current_turn
+    game_state.current_turn = "blue"
+    game_state.turn_start_time = now  # Start Blue's turn timer
+    # Reset Blue's action limit for the new turn
+    game_state.blue_action_this_turn = False
+    logger.debug("[TURN] Turn changed from %s to Blue (%s) at %s", old_turn, reason, game_state.turn_start_time)
+    return [turn_changed_event("blue", reason, old_turn, game_state.turn_start_time, now)]
@@ -0,0 +1,53 @@
+"""Team vote tallies with incrementally maintained counts."""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class VoteTally:
+    """Votes on one question (player_name -> choice), with running per-choice counts."""
+    votes: Dict[str, str] = field(default_factory=dict)  # player_name -> choice
+    counts: Counter = field(default_factory=Counter)
+    completed: bool = False  # Majority bonus already awarded
+    
+    @classmethod
+    def from_votes(cls, votes: Dict[str, str]) -> "VoteTally":
+        """Wrap an existing votes dict (kept by reference), counting it once."""
+        return cls(votes=votes, counts=Counter(votes.values()))
+    
+    def cast(self, player_name: str, choice: str):
+        """Record (or change) a player's vote, adjusting counts incrementally."""
+        previous = self.votes.get(player_name)
+        if previous == choice:
+            return
+        if previous is not None:
+            self.counts[previous] -= 1
+            if not self.counts[previous]:
+                del self.counts[previous]
+        self.votes[player_name] = choice
+        self.counts[choice] += 1
+    
+    def majority(self) -> Tuple[Optional[str], bool]:
+        """Leading choice and whether it has more than half of the votes."""
+        top = self.counts.most_common(1)
+        choice, count = top[0] if top else (None, 0)
+        return choice, count > len(self.votes) / 2
+
+
+# Tallies over GameState's per-game vote dicts, keyed by field name
+_game_tallies: Dict[str, VoteTally] = {}
+
+
+def game_vote_tally(game_state, votes_field: str) -> VoteTally:
+    """
+    Tally backed by game_state.<votes_field>.
+    
+    Game start/reset assigns a fresh dict to the field; the tally is rebuilt (one pass)
+    whenever the field no longer holds the dict it wraps.
+    """
+    votes = getattr(game_state, votes_field)
+    tally = _game_tallies.get(votes_field)
+    if tally is None or tally.votes is not votes:
+        tally = _game_tallies[votes_field] = VoteTally.from_votes(votes)
+    return tally
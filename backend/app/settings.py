@@ -29,6 +29,12 @@ class Settings(BaseSettings):
     # WebSocket settings
     WS_COALESCE_MS: int = 150  # Event coalescence window (only if snapshot enabled)
     
+    # Game limits
+    MAX_BLUE_ACTIONS_PER_ROUND: int = 50  # Oldest blue actions are dropped beyond this
+    
+    # Logging (per-connection WebSocket logs are INFO/DEBUG; set LOG_LEVEL=INFO in dev)
+    LOG_LEVEL: str = "WARNING"
+    
     # Auth settings (only used if FEATURE_AUTH_GM is True)
     # Default admin credentials: username="admin", password="admin"
     # Change these in production via environment variables!
@@ -1,30 +1,52 @@
 """In-memory event store for MVP (optional, only used if FEATURE_WS_SNAPSHOT=True)."""
-from typing import List
+from collections import deque
+from typing import Any, Deque, Dict, List
 from app.models import Event
 
+# Keep only the last N events
+MAX_EVENTS = 100
+
 # In-memory event log (for snapshot/resync when FEATURE_WS_SNAPSHOT=True)
-_event_log: List[Event] = []
+_event_log: Deque[Event] = deque(maxlen=MAX_EVENTS)
+# Wire form of each logged event, serialized once on insert so snapshots don't re-serialize
+_serialized_log: Deque[Dict[str, Any]] = deque(maxlen=MAX_EVENTS)
 
 
 def add_event(event: Event):
     """Add event to in-memory log (only used if snapshot feature is enabled)."""
     from app.settings import settings
+    from app.ws import serialize_event
     if settings.FEATURE_WS_SNAPSHOT:
         _event_log.append(event)
-        # Keep only last 100 events
-        if len(_event_log) > 100:
-            _event_log.pop(0)
+        _serialized_log.append(serialize_event(event))
+
+
+def add_events(events: List[Event]):
+    """Add several events to the in-memory log in order (only used if snapshot feature is enabled)."""
+    from app.settings import settings
+    from app.ws import serialize_event
+    if settings.FEATURE_WS_SNAPSHOT:
+        _event_log.extend(events)
+        _serialized_log.extend(serialize_event(event) for event in events)
 
 
 def get_recent_events(limit: int = 50) -> List[Event]:
     """Get recent events (only used if snapshot feature is enabled)."""
     from app.settings import settings
     if settings.FEATURE_WS_SNAPSHOT:
-        return _event_log[-limit:]
+        return list(_event_log)[-limit:]
+    return []
+
+
+def get_recent_serialized_events(limit: int = 50) -> List[Dict[str, Any]]:
+    """Get recent events already serialized for clients (only used if snapshot feature is enabled)."""
+    from app.settings import settings
+    if settings.FEATURE_WS_SNAPSHOT:
+        return list(_serialized_log)[-limit:]
     return []
 
 
 def clear_events():
     """Clear event log (called on game reset)."""
     _event_log.clear()
-
+    _serialized_log.clear()
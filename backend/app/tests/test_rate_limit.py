@@ -0,0 +1,54 @@
+"""Tests for the sliding-window rate limiter."""
+import pytest
+from app.services import rate_limit
+from app.services.rate_limit import SlidingWindowRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the rate limiter."""
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_limit_hit_within_window(clock):
+    """Test requests over the limit are rejected and not counted."""
+    limiter = SlidingWindowRateLimiter(window_seconds=60, max_requests=3)
+    
+    assert [limiter.allow("1.2.3.4") for _ in range(3)] == [True, True, True]
+    assert not limiter.allow("1.2.3.4")
+    assert len(limiter._requests["1.2.3.4"]) == 3
+    
+    # Other IPs have their own window
+    assert limiter.allow("5.6.7.8")
+
+
+def test_window_expiry(clock):
+    """Test requests are allowed again once the oldest fall out of the window."""
+    limiter = SlidingWindowRateLimiter(window_seconds=60, max_requests=2)
+    limiter.allow("1.2.3.4")
+    clock[0] += 30
+    limiter.allow("1.2.3.4")
+    assert not limiter.allow("1.2.3.4")
+    
+    # First request expires; the second is still inside the window
+    clock[0] += 30
+    assert limiter.allow("1.2.3.4")
+    assert not limiter.allow("1.2.3.4")
+
+
+def test_sweep_drops_idle_ips(clock):
+    """Test the periodic sweep forgets IPs with no recent requests."""
+    limiter = SlidingWindowRateLimiter(window_seconds=60, max_requests=5)
+    limiter.allow("1.2.3.4")
+    clock[0] += 45
+    limiter.allow("5.6.7.8")
+    
+    # Next request after the sweep is due: only the IP active within the window survives
+    clock[0] += 30
+    limiter.allow("9.9.9.9")
+    
+    assert "1.2.3.4" not in limiter._requests
+    assert "5.6.7.8" in limiter._requests
+    assert "9.9.9.9" in limiter._requests
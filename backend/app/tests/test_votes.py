@@ -0,0 +1,79 @@
+"""Tests for team vote tallies."""
+import pytest
+from app.services.votes import VoteTally, game_vote_tally
+from app.models import GameState
+
+
+def test_revote_same_choice_not_double_counted():
+    """Test re-casting the same vote leaves the counts unchanged."""
+    tally = VoteTally()
+    tally.cast("alice", "block_ip")
+    tally.cast("alice", "block_ip")
+    
+    assert tally.votes == {"alice": "block_ip"}
+    assert tally.counts == {"block_ip": 1}
+
+
+def test_changed_vote_moves_count():
+    """Test changing a vote moves it from the old choice to the new one."""
+    tally = VoteTally()
+    tally.cast("alice", "block_ip")
+    tally.cast("bob", "block_ip")
+    tally.cast("alice", "update_waf")
+    
+    assert tally.votes == {"alice": "update_waf", "bob": "block_ip"}
+    assert tally.counts == {"block_ip": 1, "update_waf": 1}
+    
+    tally.cast("bob", "update_waf")
+    
+    # Choices with no votes left are dropped
+    assert tally.counts == {"update_waf": 2}
+    assert tally.majority() == ("update_waf", True)
+
+
+def test_majority_requires_more_than_half():
+    """Test exactly half of the votes is not a majority."""
+    tally = VoteTally()
+    tally.cast("alice", "blocked")
+    tally.cast("bob", "succeeded")
+    
+    _, has_majority = tally.majority()
+    assert not has_majority
+    
+    tally.cast("carol", "blocked")
+    
+    assert tally.majority() == ("blocked", True)
+
+
+def test_majority_no_votes():
+    """Test an empty tally has no majority."""
+    assert VoteTally().majority() == (None, False)
+
+
+def test_from_votes_counts_existing_dict():
+    """Test wrapping an existing votes dict counts it and keeps it by reference."""
+    votes = {"alice": "lateral", "bob": "lateral", "carol": "persistence"}
+    tally = VoteTally.from_votes(votes)
+    
+    assert tally.votes is votes
+    assert tally.counts == {"lateral": 2, "persistence": 1}
+
+
+def test_game_vote_tally_rebuilt_after_reset():
+    """Test the game tally follows game_state when the votes field is replaced."""
+    game_state = GameState()
+    tally = game_vote_tally(game_state, "blue_ip_votes")
+    tally.cast("alice", "10.0.0.1")
+    
+    # Same dict: same tally, and votes land in game_state
+    assert game_vote_tally(game_state, "blue_ip_votes") is tally
+    assert game_state.blue_ip_votes == {"alice": "10.0.0.1"}
+    
+    # Game start/reset assigns a fresh dict
+    game_state.blue_ip_votes = {}
+    fresh = game_vote_tally(game_state, "blue_ip_votes")
+    
+    assert fresh is not tally
+    assert fresh.votes is game_state.blue_ip_votes
+    assert not fresh.counts
+    assert fresh.majority() == (None, False)
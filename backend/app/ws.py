@@ -1,11 +1,28 @@
 """WebSocket event broadcasting."""
+import asyncio
+import logging
 import socketio
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from engineio import packet as eio_packet
+from socketio import packet as sio_packet
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import uuid
+from app import json_codec
 from app.models import Event, EventKind
 from app.settings import settings
 
+logger = logging.getLogger("pewpew.ws")
+
+# Fan-out batch size: larger broadcasts yield to the event loop between batches
+BROADCAST_BATCH_SIZE = 50
+
+# Role rooms; membership itself is tracked by the Socket.IO manager
+ROLE_ROOMS = frozenset({"gm", "red", "blue", "audience"})
+
+# Fields every client receives (v2 timing fields are added only behind feature flags)
+_LEGACY_EVENT_FIELDS = {"id", "kind", "ts", "payload"}
+
 
 class GameEventBroadcaster:
     """Manages WebSocket rooms and event broadcasting."""
@@ -16,25 +33,26 @@ class GameEventBroadcaster:
             async_mode="asgi",
             logger=False,
             engineio_logger=False,
+            json=json_codec,
         )
         # Configure Socket.IO - socketio_path="/" because we mount at /socket.io in main.py
         # Socket.IO will handle requests at /socket.io/ (root of mounted path)
         self.app = socketio.ASGIApp(self.sio, socketio_path="/")
-        self.rooms = {
-            "gm": [],
-            "red": [],
-            "blue": [],
-            "audience": [],
-        }
         # Track session-scoped rooms: {session_id: {role: [sid, ...]}}
         self.session_rooms: Dict[str, Dict[str, List[str]]] = {}
+        # Reverse index for O(rooms-joined) disconnect cleanup: {sid: [(scope, session_id, role), ...]}
+        # scope is "role" (session_id is None) or "session"
+        self.sid_index: Dict[str, List[Tuple[str, Optional[str], str]]] = defaultdict(list)
+        # Last reconnection snapshot: (cache_key, snapshot body without server_ts)
+        self._snapshot_cache: Optional[Tuple[Tuple, Dict[str, Any]]] = None
     
     async def join_room(self, sid: str, role: str):
         """Join a role-specific room."""
-        if role in self.rooms:
+        if role in ROLE_ROOMS:
             await self.sio.enter_room(sid, role)
-            if sid not in self.rooms[role]:
-                self.rooms[role].append(sid)
+            entry = ("role", None, role)
+            if entry not in self.sid_index[sid]:
+                self.sid_index[sid].append(entry)
     
     async def join_session_room(self, sid: str, session_id: str, role: str):
         """Join a session-scoped room and track it."""
@@ -48,8 +66,9 @@ class GameEventBroadcaster:
             self.session_rooms[session_id][role] = []
         if sid not in self.session_rooms[session_id][role]:
             self.session_rooms[session_id][role].append(sid)
+            self.sid_index[sid].append(("session", session_id, role))
         
-        print(f"[WS] Client {sid} joined session room: {room_name} (total: {len(self.session_rooms[session_id][role])} clients)")
+        logger.info("Client %s joined session room: %s (total: %d clients)", sid, room_name, len(self.session_rooms[session_id][role]))
     
     async def leave_session_room(self, sid: str, session_id: str, role: str):
         """Leave a session-scoped room and untrack it."""
@@ -60,37 +79,118 @@ class GameEventBroadcaster:
         if session_id in self.session_rooms and role in self.session_rooms[session_id]:
             if sid in self.session_rooms[session_id][role]:
                 self.session_rooms[session_id][role].remove(sid)
+                self._unindex(sid, ("session", session_id, role))
             # Clean up empty rooms
             if not self.session_rooms[session_id][role]:
                 del self.session_rooms[session_id][role]
             if not self.session_rooms[session_id]:
                 del self.session_rooms[session_id]
         
-        print(f"[WS] Client {sid} left session room: {room_name}")
+        logger.info("Client %s left session room: %s", sid, room_name)
     
     async def leave_room(self, sid: str, role: str):
         """Leave a role-specific room."""
-        if role in self.rooms and sid in self.rooms[role]:
+        entry = ("role", None, role)
+        if entry in self.sid_index.get(sid, ()):
             await self.sio.leave_room(sid, role)
-            self.rooms[role].remove(sid)
+            self._unindex(sid, entry)
+    
+    def _unindex(self, sid: str, entry: Tuple[str, Optional[str], str]):
+        """Drop a single room membership from the reverse index."""
+        entries = self.sid_index.get(sid)
+        if entries and entry in entries:
+            entries.remove(entry)
+            if not entries:
+                del self.sid_index[sid]
+    
+    def has_subscribers(self, role: str) -> bool:
+        """Whether any client is currently in the role room."""
+        return bool(self.sio.manager.rooms.get("/", {}).get(role))
     
     async def emit_to_role(self, role: str, event: Event):
         """Emit event to all clients in a role room."""
+        if not self.has_subscribers(role):
+            return  # Skip serializing for an empty room
         payload = self._prepare_event_payload(event)
-        await self.sio.emit("game_event", payload, room=role)
+        await self.batched_emit("game_event", payload, room=role)
     
     async def emit_to_all(self, event: Event):
         """Emit event to all connected clients."""
         payload = self._prepare_event_payload(event)
-        event_kind_str = event.kind.value if hasattr(event.kind, 'value') else str(event.kind)
         
         # Strategy: Use broadcast to reach all clients efficiently
         # Broadcast reaches all connected clients regardless of room membership
         # This is more efficient than emitting to multiple rooms which can cause duplicates
-        await self.sio.emit("game_event", payload)
+        await self.batched_emit("game_event", payload)
+        self._log_broadcast(event)
+    
+    async def emit_many_to_all(self, events: List[Event]):
+        """
+        Emit several events to all connected clients in one pass.
+        
+        Each event is encoded once and every client gets all frames, in order, from a
+        single send task, instead of one full broadcast per event.
+        """
+        if not events or "/" not in self.sio.manager.rooms:
+            return  # Nothing to send / no clients connected yet
+        frames = []
+        for event in events:
+            frames.extend(self._encode_frames("game_event", self._prepare_event_payload(event)))
+        await self._send_frames(list(self.sio.manager.get_participants("/", None)), frames)
+        for event in events:
+            self._log_broadcast(event)
+    
+    def _log_broadcast(self, event: Event):
+        event_kind_str = event.kind.value if hasattr(event.kind, 'value') else str(event.kind)
         # Only log important events to reduce console noise
         if event_kind_str in ['attack_launched', 'attack_resolved', 'round_started', 'round_ended']:
-            print(f"[WS] Emitted {event_kind_str} event to all clients (broadcast)")
+            logger.info("Emitted %s event to all clients (broadcast)", event_kind_str)
+    
+    async def batched_emit(self, event_name: str, data: Any, room: Optional[str] = None, batch: int = BROADCAST_BATCH_SIZE):
+        """
+        Emit to a room (or all clients when room is None) in batches.
+        
+        The packet is encoded once and the same Engine.IO frames are sent to every
+        recipient; between batches we yield so a large fan-out cannot monopolize the
+        event loop.
+        """
+        if "/" not in self.sio.manager.rooms:
+            return  # No clients connected yet
+        recipients = list(self.sio.manager.get_participants("/", room))
+        if not recipients:
+            return
+        await self._send_frames(recipients, self._encode_frames(event_name, data), batch)
+    
+    def _encode_frames(self, event_name: str, data: Any) -> List[eio_packet.Packet]:
+        """Encode a Socket.IO event once into the Engine.IO frames sent to each client."""
+        encoded = self.sio.packet_class(sio_packet.EVENT, namespace="/", data=[event_name, data]).encode()
+        if not isinstance(encoded, list):
+            encoded = [encoded]
+        return [eio_packet.Packet(eio_packet.MESSAGE, p) for p in encoded]
+    
+    async def _send_frames(self, recipients: List[Tuple[str, str]], frames: List[eio_packet.Packet], batch: int = BROADCAST_BATCH_SIZE):
+        """
+        Send pre-encoded frames to (sid, eio_sid) recipients, yielding between batches.
+        
+        Each Engine.IO socket has its own outbound queue drained by its own writer task,
+        so a send only enqueues. A client whose send errors is disconnected without
+        holding up the others.
+        """
+        async def send_frames(eio_sid):
+            for frame in frames:
+                await self.sio.eio.send_packet(eio_sid, frame)
+        
+        for start in range(0, len(recipients), batch):
+            chunk = recipients[start:start + batch]
+            results = await asyncio.gather(
+                *(send_frames(eio_sid) for _, eio_sid in chunk),
+                return_exceptions=True,
+            )
+            for (sid, _), result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    logger.warning("Dropping client %s after failed broadcast send: %r", sid, result)
+                    await self.sio.disconnect(sid)
+            await asyncio.sleep(0)
     
     def _prepare_event_payload(self, event: Event) -> Dict[str, Any]:
         """
@@ -99,60 +199,101 @@ class GameEventBroadcaster:
         Always emits legacy shape. If FEATURE_TIMELINE_SLA is True, adds optional v2 fields.
         Legacy clients ignore unknown keys.
         """
-        event_dict = event.model_dump()
-        
         # Always emit legacy shape for compatibility
         payload = {
             "type": "game_event",
-            "event": {
-                "id": event_dict["id"],
-                "kind": event_dict["kind"].value if hasattr(event_dict["kind"], "value") else event_dict["kind"],
-                "ts": event_dict["ts"].isoformat() if isinstance(event_dict["ts"], datetime) else event_dict["ts"],
-                "payload": event_dict["payload"],
-            }
+            "event": serialize_event(event),
         }
         
-        # Add v2 fields only if feature flag is enabled
+        # Mark v2 payloads (serialize_event added the timing fields)
         if settings.FEATURE_TIMELINE_SLA or settings.FEATURE_WS_SNAPSHOT:
             payload["v"] = "2"
-            
-            # Add optional timing fields if present
-            if event.server_ts:
-                payload["event"]["server_ts"] = event.server_ts.isoformat()
-            if event.client_ts:
-                payload["event"]["client_ts"] = event.client_ts.isoformat()
-            if event.correlation_id:
-                payload["event"]["correlation_id"] = event.correlation_id
-            if event.caused_by:
-                payload["event"]["caused_by"] = event.caused_by
-            if event.deadline_at:
-                payload["event"]["deadline_at"] = event.deadline_at.isoformat()
-            if event.latency_ms is not None:
-                payload["event"]["latency_ms"] = event.latency_ms
         
         return payload
     
-    async def emit_snapshot_state(self, sid: str, game_state: Dict[str, Any], recent_events: List[Event]):
+    async def emit_snapshot_state(self, sid: str, game_state: Dict[str, Any], recent_events: List[Dict[str, Any]]):
         """
         Emit snapshot state for reconnection (only if FEATURE_WS_SNAPSHOT=True).
         
-        Provides minimal game state + last N events for fast resync.
+        Provides minimal game state + last N events for fast resync. recent_events are
+        already serialized (see store.get_recent_serialized_events).
         """
         if not settings.FEATURE_WS_SNAPSHOT:
             return  # Skip if feature disabled
         
-        snapshot = {
-            "type": "snapshot_state",
-            "game_state": game_state,
-            "events": [self._prepare_event_payload(e)["event"] for e in recent_events[-50:]],  # Last 50 events
-            "server_ts": datetime.utcnow().isoformat(),
-        }
+        recent_events = recent_events[-50:]  # Last 50 events
+        
+        # Reconnect storms request the same snapshot many times; reuse it until state or events change
+        cache_key = (
+            tuple(game_state.items()),
+            recent_events[-1]["id"] if recent_events else None,
+            len(recent_events),
+        )
+        if self._snapshot_cache is None or self._snapshot_cache[0] != cache_key:
+            self._snapshot_cache = (cache_key, {
+                "type": "snapshot_state",
+                "game_state": game_state,
+                "events": recent_events,
+            })
+        
+        snapshot = dict(self._snapshot_cache[1], server_ts=datetime.utcnow().isoformat())
         await self.sio.emit("snapshot_state", snapshot, room=sid)
     
     async def emit_to_roles(self, roles: List[str], event: Event):
-        """Emit event to multiple role rooms."""
+        """
+        Emit event to multiple role rooms.
+        
+        The event is serialized and encoded once and the same frames go to every member
+        of the rooms (a client in several of them receives it once).
+        """
+        await self.emit_many_to_roles(roles, [event])
+    
+    async def emit_many_to_roles(self, roles: List[str], events: List[Event]):
+        """
+        Emit several events to multiple role rooms in one pass.
+        
+        Like emit_many_to_all: each event is encoded once and every member of the rooms
+        gets all frames, in order, from a single send task.
+        """
+        if not events or "/" not in self.sio.manager.rooms:
+            return  # Nothing to send / no clients connected yet
+        recipients = {}
         for role in roles:
-            await self.emit_to_role(role, event)
+            for sid, eio_sid in self.sio.manager.get_participants("/", role):
+                recipients[sid] = eio_sid
+        if not recipients:
+            return
+        frames = []
+        for event in events:
+            frames.extend(self._encode_frames("game_event", self._prepare_event_payload(event)))
+        await self._send_frames(list(recipients.items()), frames)
+
+
+def serialize_event(event: Event) -> Dict[str, Any]:
+    """
+    Serialize an event to the dict sent to clients.
+    
+    Legacy fields always; v2 timing fields only if FEATURE_TIMELINE_SLA or FEATURE_WS_SNAPSHOT.
+    """
+    # mode="json" lets pydantic-core convert enums/datetimes in one pass
+    event_dict = event.model_dump(mode="json", include=_LEGACY_EVENT_FIELDS)
+    
+    if settings.FEATURE_TIMELINE_SLA or settings.FEATURE_WS_SNAPSHOT:
+        # Add optional timing fields if present
+        if event.server_ts:
+            event_dict["server_ts"] = event.server_ts.isoformat()
+        if event.client_ts:
+            event_dict["client_ts"] = event.client_ts.isoformat()
+        if event.correlation_id:
+            event_dict["correlation_id"] = event.correlation_id
+        if event.caused_by:
+            event_dict["caused_by"] = event.caused_by
+        if event.deadline_at:
+            event_dict["deadline_at"] = event.deadline_at.isoformat()
+        if event.latency_ms is not None:
+            event_dict["latency_ms"] = event.latency_ms
+    
+    return event_dict
 
 
 # Global broadcaster instance
@@ -77,6 +77,8 @@ export function useWebSocket(role: 'gm' | 'red' | 'blue' | 'audience' | null) {
   const errorCountRef = useRef<number>(0);
   const isConnectingRef = useRef<boolean>(false);
   const roleRef = useRef(role);
+  // Attack each Blue vote map belongs to (vote events only carry the new vote)
+  const voteAttackRef = useRef<Record<string, string>>({});
 
   // Update role ref when it changes
   useEffect(() => {
@@ -338,7 +340,14 @@ export function useWebSocket(role: 'gm' | 'red' | 'blue' | 'audience' | null) {
       // Handle action_identified events
       if (event.kind === EventKind.ACTION_IDENTIFIED || event.kind === 'action_identified' || event.kind === 'ACTION_IDENTIFIED') {
         if (store.gameState) {
-          const votes = event.payload?.votes || {};  // Full votes dict (player_name -> action_type)
+          // Merge this player's vote (the map from game state seeds late joiners); start fresh for a new attack
+          const prevAttack = voteAttackRef.current.action;
+          const sameAttack = prevAttack === undefined || prevAttack === event.payload?.attack_id;
+          voteAttackRef.current.action = event.payload?.attack_id;
+          const votes = {
+            ...(sameAttack ? store.gameState.blue_action_votes || {} : {}),
+            [event.payload?.player_name]: event.payload?.action_type,
+          };
           const totalVotes = event.payload?.total_votes || 0;
           
           store.setGameState({
@@ -353,7 +362,14 @@ export function useWebSocket(role: 'gm' | 'red' | 'blue' | 'audience' | null) {
       // Handle investigation_completed events
       if (event.kind === EventKind.INVESTIGATION_COMPLETED || event.kind === 'investigation_completed' || event.kind === 'INVESTIGATION_COMPLETED') {
         if (store.gameState) {
-          const votes = event.payload?.votes || {};  // Full votes dict (player_name -> attack_status)
+          // Merge this player's vote (the map from game state seeds late joiners); start fresh for a new attack
+          const prevAttack = voteAttackRef.current.investigation;
+          const sameAttack = prevAttack === undefined || prevAttack === event.payload?.attack_id;
+          voteAttackRef.current.investigation = event.payload?.attack_id;
+          const votes = {
+            ...(sameAttack ? store.gameState.blue_investigation_votes || {} : {}),
+            [event.payload?.player_name]: event.payload?.attack_status,
+          };
           const totalVotes = event.payload?.total_votes || 0;
           
           store.setGameState({